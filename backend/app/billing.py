@@ -368,8 +368,9 @@ def track_usage(user, usage_type: str, quantity: int = 1, extra_data: dict = Non
     
     db = SessionLocal()
     try:
-        # Calculate credits
-        billing = BillingManager()
+        # Calculate credits (reuse the module singleton; everything below
+        # lands in the single commit at the end)
+        billing = billing_manager
         credits_needed = billing.calculate_credits_for_usage(usage_type, quantity)
         
         # Create usage record
@@ -1,4 +1,4 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from app.config import settings
@@ -17,8 +17,11 @@ if is_postgres:
     # PostgreSQL configuration
     engine = create_engine(
         SQLALCHEMY_DATABASE_URL,
-        pool_pre_ping=True,  # Verify connections before using
-        pool_recycle=300,    # Recycle connections after 5 minutes
+        pool_pre_ping=True,   # Verify connections before using
+        pool_recycle=1800,    # Recycle connections after 30 minutes
+        pool_size=20,
+        max_overflow=40,
+        query_cache_size=1200,  # Reuse compiled statements across requests
         echo=False
     )
 else:
@@ -26,12 +29,20 @@ else:
     # Ensure storage directory exists
     if not os.path.exists("./storage"):
         os.makedirs("./storage")
-    
+
     engine = create_engine(
-        SQLALCHEMY_DATABASE_URL, 
-        connect_args={"check_same_thread": False}
+        SQLALCHEMY_DATABASE_URL,
+        connect_args={"check_same_thread": False},
+        query_cache_size=1200,  # Reuse compiled statements across requests
     )
 
+    # SQLite ignores ON DELETE CASCADE unless foreign keys are enabled
+    @event.listens_for(engine, "connect")
+    def _enable_sqlite_foreign_keys(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
+
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 Base = declarative_base()
@@ -1,9 +1,26 @@
+import asyncio
+import multiprocessing
 import os
 import json
+from concurrent.futures import ProcessPoolExecutor
 from pypdf import PdfReader
 from docx import Document
 from io import BytesIO
 
+# Lazily-created worker pool for CPU-bound extraction. PDF/DOCX parsing is
+# pure Python and holds the GIL, so running it in a separate process keeps
+# the event loop responsive during large uploads.
+_extract_pool = None
+
+def _get_extract_pool():
+    global _extract_pool
+    if _extract_pool is None:
+        # spawn: forking a threaded server process is not fork-safe
+        _extract_pool = ProcessPoolExecutor(
+            max_workers=2, mp_context=multiprocessing.get_context("spawn")
+        )
+    return _extract_pool
+
 ALLOWED_EXTENSIONS = {'.pdf', '.docx', '.json', '.txt', '.csv', '.png', '.jpg', '.jpeg'}
 FORBIDDEN_EXTENSIONS = {'.js', '.ts', '.py', '.sh', '.exe', '.bat', '.bin', '.php', '.vbs'}
 
@@ -67,5 +84,12 @@ def extract_text(filename: str, content: bytes):
     except Exception as e:
         print(f"Extraction error for {filename}: {e}")
         text = f"Error extracting text from {filename}"
-        
+
     return text.strip()
+
+async def extract_text_async(filename: str, content: bytes):
+    """
+    Run extract_text in the worker pool so it doesn't block the event loop.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_extract_pool(), extract_text, filename, content)
@@ -6,17 +6,27 @@ Fetches job listings from multiple sources for worldwide coverage including Indi
 import os
 import requests
 import random
+import threading
+import time
 from typing import List, Dict, Any, Optional
 from datetime import datetime, timedelta
 
 class GlobalJobFetcher:
     """Fetch real job listings from multiple global sources."""
-    
+
+    # External APIs are slow and rate-limited; identical searches within
+    # the TTL are served from memory instead of re-hitting every source
+    CACHE_TTL = 300  # seconds
+    CACHE_MAX_ENTRIES = 512
+
     def __init__(self):
         # API Keys (optional - falls back to mock data if not configured)
         self.adzuna_app_id = os.getenv("ADZUNA_APP_ID", "")
         self.adzuna_api_key = os.getenv("ADZUNA_API_KEY", "")
         self.jooble_api_key = os.getenv("JOOBLE_API_KEY", "")
+
+        self._cache = {}  # request args -> (expires_at, jobs tuple)
+        self._cache_lock = threading.Lock()
         
         # Country configurations for better coverage
         self.country_configs = {
@@ -41,8 +51,15 @@ class GlobalJobFetcher:
         country: str = ""
     ) -> List[Dict[str, Any]]:
         """Fetch jobs from multiple sources for global coverage."""
+        cache_key = (query, location, work_type, experience_level, page, limit, country)
+        with self._cache_lock:
+            entry = self._cache.get(cache_key)
+            if entry is not None and entry[0] >= time.monotonic():
+                # Return fresh dict copies; callers mutate the results
+                return [dict(job) for job in entry[1]]
+
         all_jobs = []
-        
+
         # Try multiple countries if no specific country
         countries_to_search = [country] if country else ['us', 'in', 'gb', 'ca', 'au', 'de']
         
@@ -79,8 +96,18 @@ class GlobalJobFetcher:
         
         # Shuffle to mix sources
         random.shuffle(all_jobs)
-        
-        return all_jobs[:limit]
+
+        results = all_jobs[:limit]
+        with self._cache_lock:
+            if len(self._cache) >= self.CACHE_MAX_ENTRIES:
+                now = time.monotonic()
+                for stale in [k for k, (exp, _) in self._cache.items() if exp < now]:
+                    del self._cache[stale]
+            self._cache[cache_key] = (
+                time.monotonic() + self.CACHE_TTL,
+                tuple(dict(job) for job in results),
+            )
+        return results
     
     def _fetch_adzuna_jobs(
         self,
@@ -10,6 +10,15 @@ def embed(text: str):
         input=text
     ).data[0].embedding
 
+def embed_batch(texts):
+    # One API round-trip for the whole batch (the endpoint accepts up
+    # to 2048 inputs) instead of a call per text
+    response = client.embeddings.create(
+        model=settings.EMBED_MODEL,
+        input=list(texts)
+    )
+    return [item.embedding for item in response.data]
+
 def stream_chat(messages, tools=None, model=None):
     params = {
         "model": model or settings.MODEL_NAME,
@@ -1,20 +1,41 @@
 from dotenv import load_dotenv
 load_dotenv()
 
+import ast
+import asyncio
+import hashlib
+import heapq
 import json
+import mmap
+import re
+import tempfile
+import threading
+import time
+
+import orjson
+from collections import defaultdict, namedtuple
 from typing import Optional, List, Dict, Any
-from fastapi import FastAPI, Depends, HTTPException, status, Request, File, UploadFile
+from fastapi import FastAPI, Depends, HTTPException, status, Request, Response, File, UploadFile
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse, FileResponse
-from sqlalchemy.orm import Session
-from sqlalchemy import func
+from fastapi.responses import StreamingResponse, FileResponse, ORJSONResponse
+from sqlalchemy.orm import Session, selectinload, joinedload
+from sqlalchemy import func, update, bindparam, text, cast, or_, tuple_, String
+from sqlalchemy.dialects.postgresql import JSONB, array
 from datetime import datetime, timedelta
 import os
+import redis
 import requests as py_requests
 from app import doc_processor
 
 from app import models, schemas, auth
 from app.database import engine, get_db, is_postgres, SQLALCHEMY_DATABASE_URL
+
+# Both dialects support INSERT ... ON CONFLICT DO NOTHING; pick the
+# matching construct once
+if is_postgres:
+    from sqlalchemy.dialects.postgresql import insert as dialect_insert
+else:
+    from sqlalchemy.dialects.sqlite import insert as dialect_insert
 from app.security import authenticate
 from app.auth import SECRET_KEY, ALGORITHM
 from jose import JWTError, jwt
@@ -24,8 +45,8 @@ from app.llm import stream_chat, chat_completion
 from app.config import settings
 from app.core_logging import logger
 from app.tools import TOOLS_DEFINITION, AVAILABLE_TOOLS
-from app.resume_generator import resume_generator
-from app.matching import matcher
+from app.resume_generator import resume_generator, generate_pdf_async, generate_docx_async
+from app.matching import matcher, skill_match_forms, score_jobs_parallel
 from app.resume_parser import resume_parser
 from app.job_fetcher import job_fetcher
 from app.billing import billing_manager, track_usage, SUBSCRIPTION_PLANS, CREDIT_PACKS, JOB_POSTING_PACKAGES
@@ -37,7 +58,9 @@ from app.billing import billing_manager, track_usage, SUBSCRIPTION_PLANS, CREDIT
 models.Base.metadata.create_all(bind=engine)
 
 log = logger()
-app = FastAPI(title=settings.APP_NAME)
+# orjson serializes response payloads in native code, 2-5x faster than
+# stdlib json on the dict/list-heavy endpoints (/jobs, /resume, /history)
+app = FastAPI(title=settings.APP_NAME, default_response_class=ORJSONResponse)
 
 # Log database info (mask credentials)
 if is_postgres:
@@ -59,7 +82,16 @@ app.add_middleware(
     ],
     allow_credentials=True,
     allow_methods=["GET", "POST", "PUT", "DELETE", "PATCH", "OPTIONS"],
-    allow_headers=["*"],
+    # Explicit list instead of "*": the preflight response becomes a static
+    # allow-list the browser can cache for the full max_age
+    allow_headers=[
+        "Authorization",
+        "Content-Type",
+        "Accept",
+        "Origin",
+        "X-Requested-With",
+        "x-api-key",
+    ],
     expose_headers=["Content-Disposition"],
     max_age=86400,  # Cache preflight for 24 hours
 )
@@ -68,13 +100,128 @@ app.add_middleware(
 # RAG Initialization
 # --------------------------------------------------
 
+def _iter_knowledge_lines(path="data/knowledge.txt"):
+    """Yield knowledge-base lines from an mmap'd file.
+
+    Avoids reading the whole file into one big string and then splitting
+    it into a second copy; lines are decoded lazily from the mapped pages.
+    """
+    with open(path, "rb") as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            start = 0
+            while start < len(mm):
+                end = mm.find(b"\n", start)
+                if end == -1:
+                    end = len(mm)
+                yield mm[start:end].decode().rstrip("\r")
+                start = end + 1
+        finally:
+            mm.close()
+
 try:
-    docs = open("data/knowledge.txt").read().splitlines()
-    rag = RAG(docs)
+    rag = RAG(_iter_knowledge_lines())
 except Exception as e:
     log.error(f"RAG init failed: {e}")
     rag = RAG([])
 
+# --------------------------------------------------
+# Request Count Buffering
+# --------------------------------------------------
+# Accumulate request_count increments in memory and flush them in a single
+# batched UPDATE every few seconds, instead of one write transaction per
+# /chat call. Counters converge within the flush interval.
+
+REQUEST_COUNT_FLUSH_INTERVAL = 5  # seconds
+
+_request_counts = defaultdict(int)
+_request_counts_lock = threading.Lock()
+
+
+def buffer_request_count(user_id: int, amount: int = 1):
+    """Record a request_count increment to be flushed later."""
+    with _request_counts_lock:
+        _request_counts[user_id] += amount
+
+
+def flush_request_counts():
+    """Flush buffered increments with one batched UPDATE."""
+    with _request_counts_lock:
+        if not _request_counts:
+            return
+        pending = dict(_request_counts)
+        _request_counts.clear()
+
+    try:
+        # Core executemany: one batched UPDATE, no per-user transactions
+        with engine.begin() as conn:
+            conn.execute(
+                update(models.User)
+                .where(models.User.id == bindparam("uid"))
+                .values(request_count=models.User.request_count + bindparam("delta")),
+                [{"uid": uid, "delta": delta} for uid, delta in pending.items()],
+            )
+    except Exception as e:
+        log.error(f"Failed to flush request counts: {e}")
+        # Re-buffer so increments aren't lost on a transient DB error
+        with _request_counts_lock:
+            for uid, delta in pending.items():
+                _request_counts[uid] += delta
+
+
+# Job view counts get the same treatment: increments buffer in memory
+# and flush as one batched UPDATE instead of a write transaction per
+# GET /jobs/{id}
+_job_view_counts = defaultdict(int)
+_job_view_counts_lock = threading.Lock()
+
+
+def buffer_job_view(job_id: int, amount: int = 1):
+    """Record a views_count increment to be flushed later."""
+    with _job_view_counts_lock:
+        _job_view_counts[job_id] += amount
+
+
+def flush_job_views():
+    """Flush buffered view increments with one batched UPDATE."""
+    with _job_view_counts_lock:
+        if not _job_view_counts:
+            return
+        pending = dict(_job_view_counts)
+        _job_view_counts.clear()
+
+    try:
+        with engine.begin() as conn:
+            conn.execute(
+                update(models.Job)
+                .where(models.Job.id == bindparam("jid"))
+                .values(views_count=models.Job.views_count + bindparam("delta")),
+                [{"jid": jid, "delta": delta} for jid, delta in pending.items()],
+            )
+    except Exception as e:
+        log.error(f"Failed to flush job views: {e}")
+        with _job_view_counts_lock:
+            for jid, delta in pending.items():
+                _job_view_counts[jid] += delta
+
+
+async def _request_count_flush_loop():
+    while True:
+        await asyncio.sleep(REQUEST_COUNT_FLUSH_INTERVAL)
+        await asyncio.get_running_loop().run_in_executor(None, flush_request_counts)
+        await asyncio.get_running_loop().run_in_executor(None, flush_job_views)
+
+
+@app.on_event("startup")
+async def start_request_count_flusher():
+    asyncio.create_task(_request_count_flush_loop())
+
+
+@app.on_event("shutdown")
+def stop_request_count_flusher():
+    flush_request_counts()
+    flush_job_views()
+
 # --------------------------------------------------
 # Health
 # --------------------------------------------------
@@ -221,6 +368,50 @@ def get_usage_stats(
             start = today - timedelta(days=30)
             end = today
 
+    # On Postgres, generate the dense time grid in SQL: one round-trip
+    # returns the already-filled series, no Python loop over up to 1440
+    # buckets every time a dashboard polls.
+    if is_postgres:
+        if interval == "hours":
+            trunc, step, fmt = "hour", "1 hour", 'YYYY-MM-DD"T"HH24:00:00'
+            grid_start = start.replace(minute=0, second=0, microsecond=0)
+        else:
+            trunc, step, fmt = "day", "1 day", "YYYY-MM-DD"
+            grid_start = datetime.combine(start.date(), datetime.min.time())
+
+        rows = db.execute(
+            text("""
+                SELECT to_char(bucket, :fmt) AS date,
+                       COALESCE(m.count, 0) AS count
+                FROM generate_series(
+                    CAST(:grid_start AS timestamp),
+                    CAST(:end AS timestamp),
+                    CAST(:step AS interval)
+                ) AS bucket
+                LEFT JOIN (
+                    SELECT date_trunc(:trunc, messages.created_at) AS bucket,
+                           COUNT(messages.id) AS count
+                    FROM messages
+                    JOIN chat_sessions ON chat_sessions.id = messages.session_id
+                    WHERE chat_sessions.user_id = :user_id
+                      AND messages.created_at >= :start
+                      AND messages.created_at <= :end
+                    GROUP BY 1
+                ) m USING (bucket)
+                ORDER BY bucket
+            """),
+            {
+                "fmt": fmt,
+                "grid_start": grid_start,
+                "start": start,
+                "end": end,
+                "step": step,
+                "trunc": trunc,
+                "user_id": current_user.id,
+            },
+        ).all()
+        return [{"date": r.date, "count": r.count} for r in rows]
+
     # Determine grouping - SQLite compatible
     if interval == "hours":
         group_func = func.strftime('%Y-%m-%dT%H:00:00', models.Message.created_at)
@@ -312,6 +503,7 @@ def train_model(
     model.training_data = req.training_data
     model.status = "Ready"
     db.commit()
+    invalidate_custom_model_cache(model_id)
     return model
 
 @app.post("/models/{model_id}/upload")
@@ -336,8 +528,8 @@ async def upload_model_file(
     if not is_safe:
         raise HTTPException(status_code=400, detail=msg)
 
-    # Extract Text
-    extracted_text = doc_processor.extract_text(file.filename, content)
+    # Extract Text (CPU-bound; runs in a process pool off the event loop)
+    extracted_text = await doc_processor.extract_text_async(file.filename, content)
     
     # Save file record
     upload_dir = f"storage/models/{model_id}"
@@ -357,7 +549,8 @@ async def upload_model_file(
     db.add(model_file)
     db.commit()
     db.refresh(model_file)
-    
+    invalidate_custom_model_cache(model_id)
+
     return {"id": model_file.id, "filename": model_file.filename}
 
 @app.get("/models/{model_id}/files")
@@ -366,15 +559,25 @@ def list_model_files(
     current_user: models.User = Depends(authenticate),
     db: Session = Depends(get_db),
 ):
-    model = db.query(models.CustomModel).filter(
+    owns_model = db.query(models.CustomModel.id).filter(
         models.CustomModel.id == model_id,
         models.CustomModel.user_id == current_user.id
     ).first()
-    
-    if not model:
+
+    if not owns_model:
         raise HTTPException(status_code=404, detail="Model not found")
-        
-    return [{"id": f.id, "filename": f.filename, "created_at": f.created_at} for f in model.files]
+
+    # Project only the listed columns; the lazy relationship would drag
+    # extracted_text (potentially megabytes per file) across the driver
+    rows = (
+        db.query(models.ModelFile.id, models.ModelFile.filename, models.ModelFile.created_at)
+        .filter(models.ModelFile.model_id == model_id)
+        .all()
+    )
+    return [
+        {"id": file_id, "filename": filename, "created_at": created_at}
+        for file_id, filename, created_at in rows
+    ]
 
 @app.delete("/models/{model_id}")
 def delete_model(
@@ -417,9 +620,10 @@ def update_model(
         model.base_model = req.base_model
     if req.status is not None:
         model.status = req.status
-        
+
     db.commit()
     db.refresh(model)
+    invalidate_custom_model_cache(model_id)
     return model
 
 @app.post("/models/{model_id}/fetch-url")
@@ -465,6 +669,7 @@ def fetch_dataset_url(
         )
         db.add(model_file)
         db.commit()
+        invalidate_custom_model_cache(model_id)
         return {"id": model_file.id, "filename": model_file.filename}
         
     except Exception as e:
@@ -473,32 +678,83 @@ def fetch_dataset_url(
 # --------------------------------------------------
 # History
 # --------------------------------------------------
+# The history pane polls these lists repeatedly; cache the serialized
+# JSON bytes for a few seconds so repeated polls short-circuit before
+# touching SQLAlchemy or re-encoding. Mutating endpoints invalidate.
+
+HISTORY_CACHE_TTL = 10  # seconds
+HISTORY_CACHE_MAX = 10_000  # entries; expired ones are pruned when full
+
+_history_cache = {}  # (user_id, archived_flag) -> (expires_at, payload_bytes)
+_history_cache_lock = threading.Lock()
+
+
+def _history_cache_get(key):
+    with _history_cache_lock:
+        entry = _history_cache.get(key)
+        if entry is None:
+            return None
+        expires_at, payload = entry
+        if expires_at < time.monotonic():
+            del _history_cache[key]
+            return None
+        return payload
+
+
+def _history_cache_set(key, payload):
+    with _history_cache_lock:
+        if len(_history_cache) >= HISTORY_CACHE_MAX:
+            now = time.monotonic()
+            for stale in [k for k, (exp, _) in _history_cache.items() if exp < now]:
+                del _history_cache[stale]
+        _history_cache[key] = (time.monotonic() + HISTORY_CACHE_TTL, payload)
+
+
+def invalidate_history_cache(user_id: int):
+    with _history_cache_lock:
+        _history_cache.pop((user_id, False), None)
+        _history_cache.pop((user_id, True), None)
+
+
+def _serialize_history(sessions):
+    return json.dumps(
+        [
+            {
+                "id": s.id,
+                "title": s.title,
+                "created_at": s.created_at,
+            }
+            for s in sessions
+        ],
+        default=lambda o: o.isoformat(),
+    ).encode()
+
 
 @app.get("/history")
 def get_history(
     current_user: models.User = Depends(authenticate),
 ):
-    return [
-        {
-            "id": s.id,
-            "title": s.title,
-            "created_at": s.created_at,
-        }
-        for s in current_user.sessions if not s.is_archived
-    ]
+    key = (current_user.id, False)
+    payload = _history_cache_get(key)
+    if payload is None:
+        payload = _serialize_history(
+            s for s in current_user.sessions if not s.is_archived
+        )
+        _history_cache_set(key, payload)
+    return Response(content=payload, media_type="application/json")
 
 @app.get("/history/archived")
 def get_archived_history(
     current_user: models.User = Depends(authenticate),
 ):
-    return [
-        {
-            "id": s.id,
-            "title": s.title,
-            "created_at": s.created_at,
-        }
-        for s in current_user.sessions if s.is_archived
-    ]
+    key = (current_user.id, True)
+    payload = _history_cache_get(key)
+    if payload is None:
+        payload = _serialize_history(
+            s for s in current_user.sessions if s.is_archived
+        )
+        _history_cache_set(key, payload)
+    return Response(content=payload, media_type="application/json")
 
 @app.post("/history/{session_id}/archive")
 def toggle_archive_session(
@@ -515,6 +771,7 @@ def toggle_archive_session(
     
     session.is_archived = 0 if session.is_archived else 1
     db.commit()
+    invalidate_history_cache(current_user.id)
     return {"message": "Session updated", "is_archived": bool(session.is_archived)}
 
 @app.post("/history/archive-all")
@@ -526,6 +783,7 @@ def archive_all_sessions(
         models.ChatSession.user_id == current_user.id
     ).update({models.ChatSession.is_archived: 1})
     db.commit()
+    invalidate_history_cache(current_user.id)
     return {"message": "All sessions archived"}
 
 @app.post("/history/delete-all")
@@ -537,6 +795,7 @@ def delete_all_sessions(
         models.ChatSession.user_id == current_user.id
     ).delete()
     db.commit()
+    invalidate_history_cache(current_user.id)
     return {"message": "All sessions deleted"}
 
 
@@ -546,8 +805,10 @@ def get_session_history(
     current_user: models.User = Depends(authenticate),
     db: Session = Depends(get_db),
 ):
-    session = (
-        db.query(models.ChatSession)
+    # Ownership check on the id column only, then a columnar select:
+    # no full Message ORM objects for what is a two-field payload.
+    owns_session = (
+        db.query(models.ChatSession.id)
         .filter(
             models.ChatSession.id == session_id,
             models.ChatSession.user_id == current_user.id,
@@ -555,27 +816,77 @@ def get_session_history(
         .first()
     )
 
-    if not session:
+    if not owns_session:
         raise HTTPException(status_code=404, detail="Session not found")
 
-    return [
-        {"role": m.role, "content": m.content}
-        for m in session.messages
-    ]
+    rows = (
+        db.query(models.Message.role, models.Message.content)
+        .filter(models.Message.session_id == session_id)
+        .order_by(models.Message.id)
+        .all()
+    )
+
+    return [{"role": role, "content": content} for role, content in rows]
 
 # --------------------------------------------------
 # Chat (Agentic + Streaming)
 # --------------------------------------------------
 
+# Compiled once; also gives us the parsed id without a split+int dance
+_CUSTOM_MODEL_RE = re.compile(r"^custom-(\d+)$")
+
+# Custom-model content rarely changes mid-session; cache the resolved
+# (base_model, knowledge) per model id so /chat skips the SELECT + files
+# join on every call.
+CUSTOM_MODEL_CACHE_TTL = 60  # seconds
+
+_custom_model_cache = {}  # m_id -> (expires_at, base_model, knowledge_tuple)
+_custom_model_cache_lock = threading.Lock()
+
+
+def invalidate_custom_model_cache(m_id: int):
+    with _custom_model_cache_lock:
+        _custom_model_cache.pop(m_id, None)
+
+
+def _resolve_custom_model(m_id: int, db: Session):
+    """Return (base_model, knowledge_tuple) for a custom model id, cached."""
+    with _custom_model_cache_lock:
+        entry = _custom_model_cache.get(m_id)
+        if entry is not None and entry[0] >= time.monotonic():
+            return entry[1], entry[2]
+
+    c_model = db.query(models.CustomModel).filter(models.CustomModel.id == m_id).first()
+    if c_model:
+        base_model = c_model.base_model or "gpt-4o-mini"
+        knowledge = []
+        if c_model.training_data:
+            knowledge.append(c_model.training_data)
+        # Fetch all extracted text from associated files
+        for f in c_model.files:
+            if f.extracted_text:
+                knowledge.append(f"Content from {f.filename}:\n{f.extracted_text}")
+        knowledge = tuple(knowledge)
+    else:
+        base_model = "gpt-4o-mini"
+        knowledge = ()
+
+    with _custom_model_cache_lock:
+        _custom_model_cache[m_id] = (
+            time.monotonic() + CUSTOM_MODEL_CACHE_TTL,
+            base_model,
+            knowledge,
+        )
+    return base_model, knowledge
+
 @app.post("/chat")
 async def chat(
     req: schemas.ChatRequest,
     current_user: models.User = Depends(authenticate),
     db: Session = Depends(get_db),
 ):
-    # 1. Usage tracking
-    current_user.request_count += 1
-    db.commit()
+    # 1. Usage tracking (flushed in batches by the background flusher)
+    buffer_request_count(current_user.id)
 
     # 2. Get or create session
     if req.session_id:
@@ -597,14 +908,12 @@ async def chat(
         db.add(session)
         db.commit()
         db.refresh(session)
+        invalidate_history_cache(current_user.id)
 
-    # 3. Save user message
-    user_msg = models.Message(
-        session_id=session.id,
-        role="user",
-        content=req.message,
-    )
-    db.add(user_msg)
+    # 3. Save user message (Core insert; nothing reads the row back)
+    models.Message.bulk_create(db, [
+        {"session_id": session.id, "role": "user", "content": req.message},
+    ])
     db.commit()
 
     # 4. Build memory + context
@@ -615,25 +924,22 @@ async def chat(
 
     # Determine actual OpenAI model
     openai_model = req.model
-    custom_knowledge = []
-    if req.model and req.model.startswith("custom-"):
-        try:
-            m_id = int(req.model.split("-")[1])
-            c_model = db.query(models.CustomModel).filter(models.CustomModel.id == m_id).first()
-            if c_model:
-                openai_model = c_model.base_model or "gpt-4o-mini"
-                # Increment usage
-                c_model.usage_count += 1
-                db.commit()
-                
-                if c_model.training_data:
-                    custom_knowledge.append(c_model.training_data)
-                
-                # Fetch all extracted text from associated files
-                for f in c_model.files:
-                    if f.extracted_text:
-                        custom_knowledge.append(f"Content from {f.filename}:\n{f.extracted_text}")
-        except:
+    custom_knowledge = ()
+    is_custom_model = bool(req.model) and req.model.startswith("custom-")
+    if is_custom_model:
+        match = _CUSTOM_MODEL_RE.match(req.model)
+        if match:
+            m_id = int(match.group(1))
+            openai_model, custom_knowledge = _resolve_custom_model(m_id, db)
+            # Increment usage without loading the row
+            db.query(models.CustomModel).filter(
+                models.CustomModel.id == m_id
+            ).update(
+                {models.CustomModel.usage_count: models.CustomModel.usage_count + 1},
+                synchronize_session=False,
+            )
+            db.commit()
+        else:
             openai_model = "gpt-4o-mini"
 
     context = rag.retrieve(req.message)
@@ -642,8 +948,6 @@ async def chat(
         joined_custom = "\n\n---\n\n".join(custom_knowledge)
         context.insert(0, f"CORE CUSTOM MODEL KNOWLEDGE:\n{joined_custom}")
 
-    is_custom_model = req.model and req.model.startswith("custom-")
-
     messages = build_messages(req.message, history, context, is_custom_model=is_custom_model)
 
     # 5. Tool decision step
@@ -684,22 +988,25 @@ async def chat(
 
     # 6. Streaming final answer (SAFE DB USAGE)
     def stream_response(db_session: Session):
-        full_response = ""
+        # Collect tokens in a list and join once: O(n) instead of the
+        # O(n^2) churn of growing a string per token
+        tokens = []
 
         # Send session id once
         yield f"SESSION_ID:{session.id}\n"
 
         for chunk in stream_chat(messages, model=openai_model):
             token = chunk.choices[0].delta.content or ""
-            full_response += token
+            tokens.append(token)
             yield token
 
-        asst_msg = models.Message(
-            session_id=session.id,
-            role="assistant",
-            content=full_response,
-        )
-        db_session.add(asst_msg)
+        models.Message.bulk_create(db_session, [
+            {
+                "session_id": session.id,
+                "role": "assistant",
+                "content": "".join(tokens),
+            },
+        ])
         db_session.commit()
 
     return StreamingResponse(
@@ -740,7 +1047,159 @@ def update_user_type(
 # Resume Management (For Candidates)
 # --------------------------------------------------
 
-import ast
+# Rendered PDF/DOCX bytes keyed by content hash. The render dominates
+# latency and the preview iframe re-requests the same document repeatedly,
+# so identical (resume_data, template) pairs are served from memory.
+RESUME_RENDER_CACHE_TTL = 3600  # seconds
+RESUME_RENDER_CACHE_MAX = 256  # entries
+
+_resume_render_cache = {}  # key -> (expires_at, bytes)
+_resume_render_keys_by_user = defaultdict(set)
+_resume_render_lock = threading.Lock()
+
+
+# The resume_data shape shared by the render/ATS call sites; computed once
+# instead of rebuilding the same 20-key dict literal in five endpoints
+_RESUME_CONTENT_FIELDS = (
+    "full_name", "email", "phone", "location",
+    "linkedin_url", "portfolio_url", "github_url", "twitter_url",
+    "medium_url", "dribbble_url", "other_url",
+    "summary", "work_experience", "education", "skills",
+    "certifications", "projects", "languages",
+)
+
+
+def _resume_to_dict(resume, user_id=None):
+    data = {field: getattr(resume, field) for field in _RESUME_CONTENT_FIELDS}
+    if user_id is not None:
+        data["user_id"] = user_id
+    return data
+
+
+def _resume_render_key(resume_data, template, kind):
+    payload = orjson.dumps(resume_data, option=orjson.OPT_SORT_KEYS, default=str)
+    return hashlib.blake2b(payload + f"|{template}|{kind}".encode()).hexdigest()
+
+
+def invalidate_resume_render_cache(user_id: int):
+    with _resume_render_lock:
+        for key in _resume_render_keys_by_user.pop(user_id, ()):
+            _resume_render_cache.pop(key, None)
+
+
+async def _get_or_render_async(user_id, key, render):
+    """Return cached render bytes; `render` is an awaitable factory that
+    does the work in the resume_generator process pool."""
+    with _resume_render_lock:
+        entry = _resume_render_cache.get(key)
+        if entry is not None and entry[0] >= time.monotonic():
+            return entry[1]
+
+    data = await render()
+
+    with _resume_render_lock:
+        if len(_resume_render_cache) >= RESUME_RENDER_CACHE_MAX:
+            now = time.monotonic()
+            for stale in [k for k, (exp, _) in _resume_render_cache.items() if exp < now]:
+                del _resume_render_cache[stale]
+        _resume_render_cache[key] = (time.monotonic() + RESUME_RENDER_CACHE_TTL, data)
+        _resume_render_keys_by_user[user_id].add(key)
+    return data
+
+
+async def _iter_bytes(buf: bytes, size: int = 65536):
+    """Yield a rendered document in chunks instead of one BytesIO blob."""
+    for i in range(0, len(buf), size):
+        yield buf[i:i + size]
+
+
+# Hash-keyed on-disk copies of rendered downloads: FileResponse serves
+# them straight from disk (sendfile on Linux) instead of pushing the
+# buffer through userspace on every download.
+RESUME_RENDER_DIR = "storage/resume_cache"
+RESUME_RENDER_DIR_MAX_FILES = 256
+
+
+def _evict_render_dir():
+    try:
+        entries = [
+            os.path.join(RESUME_RENDER_DIR, name)
+            for name in os.listdir(RESUME_RENDER_DIR)
+        ]
+        if len(entries) <= RESUME_RENDER_DIR_MAX_FILES:
+            return
+        entries.sort(key=os.path.getmtime)
+        for path in entries[:len(entries) - RESUME_RENDER_DIR_MAX_FILES]:
+            os.remove(path)
+    except OSError:
+        pass
+
+
+async def _render_to_cached_file(user_id, key, ext, renderer):
+    """Materialize a render on disk under its content hash and return the path."""
+    path = os.path.join(RESUME_RENDER_DIR, f"{key}.{ext}")
+    if not os.path.exists(path):
+        data = await _get_or_render_async(user_id, key, renderer)
+
+        def _write():
+            os.makedirs(RESUME_RENDER_DIR, exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+            _evict_render_dir()
+
+        await asyncio.to_thread(_write)
+    return path
+
+# JSON list columns that historically accumulated stringified-dict
+# entries; they are normalized once at write time (and by
+# migrate_normalize_resume_json.py for existing rows), so reads never
+# re-parse
+_RESUME_JSON_LIST_FIELDS = (
+    "work_experience", "education", "certifications", "projects", "languages",
+)
+
+
+def _normalize_parsed_list(items):
+    """Coerce legacy "stringified dict" entries into real dicts."""
+    if not items:
+        return items or []
+    normalized = []
+    for item in items:
+        if isinstance(item, str) and item.startswith("{") and item.endswith("}"):
+            try:
+                parsed = ast.literal_eval(item)
+                normalized.append(parsed if isinstance(parsed, dict) else item)
+            except (ValueError, SyntaxError):
+                normalized.append(item)
+        else:
+            normalized.append(item)
+    return normalized
+
+
+def _normalize_resume_fields(data: dict):
+    for field in _RESUME_JSON_LIST_FIELDS:
+        if field in data:
+            data[field] = _normalize_parsed_list(data[field])
+    return data
+
+
+def _sync_resume_skills(db: Session, resume_id: int, skills):
+    """Mirror a resume's skills into the indexed resume_skills rows."""
+    db.query(models.ResumeSkill).filter(
+        models.ResumeSkill.resume_id == resume_id
+    ).delete(synchronize_session=False)
+    normalized = sorted({
+        skill.lower().strip() for skill in (skills or []) if isinstance(skill, str)
+    })
+    if normalized:
+        db.execute(
+            models.ResumeSkill.__table__.insert(),
+            [{"resume_id": resume_id, "skill": skill} for skill in normalized],
+        )
+    db.commit()
+
 
 @app.get("/resume")
 def get_resume(
@@ -749,34 +1208,11 @@ def get_resume(
 ):
     """Get the current user's resume."""
     resume = db.query(models.Resume).filter(models.Resume.user_id == current_user.id).first()
-    
+
     if not resume:
         raise HTTPException(status_code=404, detail="Resume not found")
-    
-    # Helper function to parse JSON fields that might be stored as strings
-    def parse_json_field(field_value):
-        if field_value is None:
-            return []
-        if isinstance(field_value, list):
-            # Check if items are strings that look like dicts
-            parsed = []
-            for item in field_value:
-                if isinstance(item, str) and item.startswith('{') and item.endswith('}'):
-                    try:
-                        # Use ast.literal_eval to safely parse Python dict strings
-                        parsed_item = ast.literal_eval(item)
-                        if isinstance(parsed_item, dict):
-                            parsed.append(parsed_item)
-                        else:
-                            parsed.append(item)
-                    except (ValueError, SyntaxError):
-                        parsed.append(item)
-                else:
-                    parsed.append(item)
-            return parsed
-        return field_value
-    
-    # Build response manually to handle JSON parsing
+
+    # Columns are normalized at write time, so no per-read parsing
     return {
         "id": resume.id,
         "user_id": resume.user_id,
@@ -792,12 +1228,12 @@ def get_resume(
         "dribbble_url": resume.dribbble_url,
         "other_url": resume.other_url,
         "summary": resume.summary,
-        "work_experience": parse_json_field(resume.work_experience),
-        "education": parse_json_field(resume.education),
+        "work_experience": resume.work_experience or [],
+        "education": resume.education or [],
         "skills": resume.skills if resume.skills else [],
-        "certifications": parse_json_field(resume.certifications),
-        "projects": parse_json_field(resume.projects),
-        "languages": parse_json_field(resume.languages),
+        "certifications": resume.certifications or [],
+        "projects": resume.projects or [],
+        "languages": resume.languages or [],
         "ats_score": resume.ats_score,
         "keywords": resume.keywords if resume.keywords else [],
         "is_public": resume.is_public,
@@ -811,6 +1247,30 @@ def get_resume(
     }
 
 
+DOCX_MEDIA_TYPE = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+
+
+def _resume_file_response(path, media_type, filename, not_found_detail="File not found"):
+    """Serve a generated resume file with a single stat call.
+
+    The stat result is handed to FileResponse so it doesn't stat again,
+    and Accept-Ranges lets large files be range-served.
+    """
+    try:
+        stat_result = os.stat(path) if path else None
+    except OSError:
+        stat_result = None
+    if stat_result is None:
+        raise HTTPException(status_code=404, detail=not_found_detail)
+    return FileResponse(
+        path,
+        stat_result=stat_result,
+        media_type=media_type,
+        filename=filename,
+        headers={"Accept-Ranges": "bytes"},
+    )
+
+
 @app.get("/resume/download/{file_type}")
 def download_resume(
     file_type: str,
@@ -819,25 +1279,23 @@ def download_resume(
 ):
     """Download resume PDF or DOCX file."""
     resume = db.query(models.Resume).filter(models.Resume.user_id == current_user.id).first()
-    
+
     if not resume:
         raise HTTPException(status_code=404, detail="Resume not found")
-    
+
     if file_type == "pdf":
-        if not resume.pdf_url or not os.path.exists(resume.pdf_url):
-            raise HTTPException(status_code=404, detail="PDF not found. Generate it first.")
-        return FileResponse(
+        return _resume_file_response(
             resume.pdf_url,
-            media_type="application/pdf",
-            filename=f"{resume.full_name.replace(' ', '_')}_resume.pdf"
+            "application/pdf",
+            f"{resume.full_name.replace(' ', '_')}_resume.pdf",
+            not_found_detail="PDF not found. Generate it first.",
         )
     elif file_type == "docx":
-        if not resume.docx_url or not os.path.exists(resume.docx_url):
-            raise HTTPException(status_code=404, detail="DOCX not found. Generate it first.")
-        return FileResponse(
+        return _resume_file_response(
             resume.docx_url,
-            media_type="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-            filename=f"{resume.full_name.replace(' ', '_')}_resume.docx"
+            DOCX_MEDIA_TYPE,
+            f"{resume.full_name.replace(' ', '_')}_resume.docx",
+            not_found_detail="DOCX not found. Generate it first.",
         )
     else:
         raise HTTPException(status_code=400, detail="Invalid file type. Use 'pdf' or 'docx'.")
@@ -854,41 +1312,48 @@ def download_candidate_resume(
     # Check if user is an organization
     if current_user.user_type != "organization":
         raise HTTPException(status_code=403, detail="Only organizations can download candidate resumes")
-    
-    # Get the company
-    company = db.query(models.Company).filter(models.Company.owner_id == current_user.id).first()
-    if not company:
-        raise HTTPException(status_code=403, detail="Company profile required")
-    
+
     # Get the resume
     resume = db.query(models.Resume).filter(models.Resume.id == resume_id).first()
     if not resume:
         raise HTTPException(status_code=404, detail="Resume not found")
-    
-    # Check if the candidate has applied to any of the company's jobs
-    has_applied = db.query(models.JobApplication).join(models.Job).filter(
-        models.JobApplication.resume_id == resume_id,
-        models.Job.company_id == company.id
-    ).first()
-    
-    if not has_applied:
+
+    # One joined query covers both the company lookup and the
+    # did-the-candidate-apply check; the authorized path runs two
+    # queries instead of three
+    has_access = (
+        db.query(models.JobApplication.id)
+        .join(models.Job, models.JobApplication.job_id == models.Job.id)
+        .join(models.Company, models.Job.company_id == models.Company.id)
+        .filter(
+            models.JobApplication.resume_id == resume_id,
+            models.Company.owner_id == current_user.id,
+        )
+        .first()
+    )
+
+    if not has_access:
+        # Distinguish the error only on the failure path
+        company = db.query(models.Company.id).filter(
+            models.Company.owner_id == current_user.id
+        ).first()
+        if not company:
+            raise HTTPException(status_code=403, detail="Company profile required")
         raise HTTPException(status_code=403, detail="You can only download resumes of candidates who applied to your jobs")
     
     if file_type == "pdf":
-        if not resume.pdf_url or not os.path.exists(resume.pdf_url):
-            raise HTTPException(status_code=404, detail="PDF not found")
-        return FileResponse(
+        return _resume_file_response(
             resume.pdf_url,
-            media_type="application/pdf",
-            filename=f"{resume.full_name.replace(' ', '_')}_resume.pdf"
+            "application/pdf",
+            f"{resume.full_name.replace(' ', '_')}_resume.pdf",
+            not_found_detail="PDF not found",
         )
     elif file_type == "docx":
-        if not resume.docx_url or not os.path.exists(resume.docx_url):
-            raise HTTPException(status_code=404, detail="DOCX not found")
-        return FileResponse(
+        return _resume_file_response(
             resume.docx_url,
-            media_type="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-            filename=f"{resume.full_name.replace(' ', '_')}_resume.docx"
+            DOCX_MEDIA_TYPE,
+            f"{resume.full_name.replace(' ', '_')}_resume.docx",
+            not_found_detail="DOCX not found",
         )
     else:
         raise HTTPException(status_code=400, detail="Invalid file type")
@@ -904,14 +1369,16 @@ def create_resume(
     # Check if resume already exists
     existing = db.query(models.Resume).filter(models.Resume.user_id == current_user.id).first()
     
-    # Calculate ATS score and extract keywords
-    resume_data = req.dict()
-    resume_data['user_id'] = current_user.id
-    ats_result = resume_generator.calculate_ats_score(resume_data)
-    
+    # Calculate ATS score and extract keywords (dump the model once)
+    resume_data = _normalize_resume_fields(req.model_dump())
+    ats_result = resume_generator.calculate_ats_score(
+        {**resume_data, 'user_id': current_user.id}
+    )
+    _ats_result_cache[current_user.id] = ats_result
+
     if existing:
         # Update existing resume
-        for field, value in req.dict().items():
+        for field, value in resume_data.items():
             setattr(existing, field, value)
         existing.ats_score = ats_result['score']
         existing.keywords = ats_result['keywords']
@@ -923,12 +1390,14 @@ def create_resume(
             user_id=current_user.id,
             ats_score=ats_result['score'],
             keywords=ats_result['keywords'],
-            **req.dict()
+            **resume_data
         )
         db.add(resume)
-    
+
     db.commit()
     db.refresh(resume)
+    _sync_resume_skills(db, resume.id, resume.skills)
+    invalidate_resume_render_cache(current_user.id)
     return resume
 
 
@@ -939,50 +1408,37 @@ def update_resume(
     db: Session = Depends(get_db),
 ):
     """Update resume fields."""
-    resume = db.query(models.Resume).filter(models.Resume.user_id == current_user.id).first()
-    
+    # Single UPDATE ... RETURNING instead of SELECT + mutate + refresh
+    update_data = _normalize_resume_fields(req.model_dump(exclude_unset=True))
+    update_data["updated_at"] = datetime.utcnow()
+
+    resume = db.execute(
+        update(models.Resume)
+        .where(models.Resume.user_id == current_user.id)
+        .values(**update_data)
+        .returning(models.Resume)
+    ).scalar_one_or_none()
+
     if not resume:
+        db.rollback()
         raise HTTPException(status_code=404, detail="Resume not found")
-    
-    # Update fields
-    update_data = req.dict(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(resume, field, value)
-    
-    # Recalculate ATS score
-    resume_data = {
-        'user_id': current_user.id,
-        'full_name': resume.full_name,
-        'email': resume.email,
-        'phone': resume.phone,
-        'location': resume.location,
-        'linkedin_url': resume.linkedin_url,
-        'portfolio_url': resume.portfolio_url,
-        'github_url': resume.github_url,
-        'twitter_url': resume.twitter_url,
-        'medium_url': resume.medium_url,
-        'dribbble_url': resume.dribbble_url,
-        'other_url': resume.other_url,
-        'summary': resume.summary,
-        'work_experience': resume.work_experience,
-        'education': resume.education,
-        'skills': resume.skills,
-        'certifications': resume.certifications,
-        'projects': resume.projects,
-        'languages': resume.languages,
-    }
+
+    # Recalculate ATS score on the returned row
+    resume_data = _resume_to_dict(resume, user_id=current_user.id)
     ats_result = resume_generator.calculate_ats_score(resume_data)
+    _ats_result_cache[current_user.id] = ats_result
     resume.ats_score = ats_result['score']
     resume.keywords = ats_result['keywords']
-    resume.updated_at = datetime.utcnow()
-    
+
     db.commit()
-    db.refresh(resume)
+    if "skills" in update_data:
+        _sync_resume_skills(db, resume.id, resume.skills)
+    invalidate_resume_render_cache(current_user.id)
     return resume
 
 
 @app.get("/resume/generate-pdf")
-def generate_resume_pdf(
+async def generate_resume_pdf(
     template: str = "modern",
     download: bool = True,
     current_user: models.User = Depends(authenticate),
@@ -1004,47 +1460,29 @@ def generate_resume_pdf(
     if template not in resume_generator.TEMPLATES:
         template = "modern"
     
-    resume_data = {
-        'user_id': current_user.id,
-        'full_name': resume.full_name,
-        'email': resume.email,
-        'phone': resume.phone,
-        'location': resume.location,
-        'linkedin_url': resume.linkedin_url,
-        'portfolio_url': resume.portfolio_url,
-        'github_url': resume.github_url,
-        'twitter_url': resume.twitter_url,
-        'medium_url': resume.medium_url,
-        'dribbble_url': resume.dribbble_url,
-        'other_url': resume.other_url,
-        'summary': resume.summary,
-        'work_experience': resume.work_experience,
-        'education': resume.education,
-        'skills': resume.skills,
-        'certifications': resume.certifications,
-        'projects': resume.projects,
-        'languages': resume.languages,
-    }
+    resume_data = _resume_to_dict(resume, user_id=current_user.id)
     
     filename = f"resume_{current_user.username or 'user'}_{template}_{int(datetime.now().timestamp())}.pdf"
     
     if download:
-        # Return file for direct download
-        pdf_bytes = resume_generator.generate_pdf(resume_data, filename, template=template, return_bytes=True)
-        
-        from fastapi.responses import StreamingResponse
-        import io
-        
-        return StreamingResponse(
-            io.BytesIO(pdf_bytes),
+        # Serve from the hash-keyed disk cache (zero-copy sendfile)
+        cache_key = _resume_render_key(resume_data, template, "pdf")
+        path = await _render_to_cached_file(
+            current_user.id,
+            cache_key,
+            "pdf",
+            lambda: generate_pdf_async(resume_data, filename, template=template, return_bytes=True),
+        )
+
+        return FileResponse(
+            path,
             media_type="application/pdf",
-            headers={
-                "Content-Disposition": f"attachment; filename={filename}"
-            }
+            filename=filename,
+            headers={"Accept-Ranges": "bytes"},
         )
     else:
         # Save to server and return URL
-        filepath = resume_generator.generate_pdf(resume_data, filename, template=template)
+        filepath = await generate_pdf_async(resume_data, filename, template=template)
         
         # Update resume with PDF URL
         resume.pdf_url = filepath
@@ -1059,7 +1497,7 @@ def generate_resume_pdf(
 
 
 @app.get("/resume/generate-docx")
-def generate_resume_docx(
+async def generate_resume_docx(
     template: str = "modern",
     download: bool = True,
     current_user: models.User = Depends(authenticate),
@@ -1081,47 +1519,29 @@ def generate_resume_docx(
     if template not in resume_generator.TEMPLATES:
         template = "modern"
     
-    resume_data = {
-        'user_id': current_user.id,
-        'full_name': resume.full_name,
-        'email': resume.email,
-        'phone': resume.phone,
-        'location': resume.location,
-        'linkedin_url': resume.linkedin_url,
-        'portfolio_url': resume.portfolio_url,
-        'github_url': resume.github_url,
-        'twitter_url': resume.twitter_url,
-        'medium_url': resume.medium_url,
-        'dribbble_url': resume.dribbble_url,
-        'other_url': resume.other_url,
-        'summary': resume.summary,
-        'work_experience': resume.work_experience,
-        'education': resume.education,
-        'skills': resume.skills,
-        'certifications': resume.certifications,
-        'projects': resume.projects,
-        'languages': resume.languages,
-    }
+    resume_data = _resume_to_dict(resume, user_id=current_user.id)
     
     filename = f"resume_{current_user.username or 'user'}_{template}_{int(datetime.now().timestamp())}.docx"
     
     if download:
-        # Return file for direct download
-        docx_bytes = resume_generator.generate_docx(resume_data, filename, template=template, return_bytes=True)
-        
-        from fastapi.responses import StreamingResponse
-        import io
-        
-        return StreamingResponse(
-            io.BytesIO(docx_bytes),
-            media_type="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-            headers={
-                "Content-Disposition": f"attachment; filename={filename}"
-            }
+        # Serve from the hash-keyed disk cache (zero-copy sendfile)
+        cache_key = _resume_render_key(resume_data, template, "docx")
+        path = await _render_to_cached_file(
+            current_user.id,
+            cache_key,
+            "docx",
+            lambda: generate_docx_async(resume_data, filename, template=template, return_bytes=True),
+        )
+
+        return FileResponse(
+            path,
+            media_type=DOCX_MEDIA_TYPE,
+            filename=filename,
+            headers={"Accept-Ranges": "bytes"},
         )
     else:
         # Save to server and return URL
-        filepath = resume_generator.generate_docx(resume_data, filename, template=template)
+        filepath = await generate_docx_async(resume_data, filename, template=template)
         
         # Update resume with DOCX URL
         resume.docx_url = filepath
@@ -1135,34 +1555,65 @@ def generate_resume_docx(
         }
 
 
+# The preview iframe re-sends the same query token on every reload;
+# cache the verified subject per token so hits skip the JWT decode.
+# Entries expire with the token (capped at 60s) so revocation-by-expiry
+# still holds.
+QUERY_TOKEN_CACHE_TTL = 60  # seconds
+QUERY_TOKEN_CACHE_MAX = 1024
+
+_query_token_cache = {}  # token -> (expires_at, email)
+_query_token_cache_lock = threading.Lock()
+
+
+def _verify_query_token(token: str) -> str:
+    """Return the token's subject email, caching verified tokens briefly."""
+    with _query_token_cache_lock:
+        entry = _query_token_cache.get(token)
+        if entry is not None and entry[0] >= time.monotonic():
+            return entry[1]
+
+    payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+    email = payload.get("sub")
+    if email is None:
+        raise HTTPException(status_code=401, detail="Invalid token")
+
+    ttl = QUERY_TOKEN_CACHE_TTL
+    exp = payload.get("exp")
+    if exp is not None:
+        ttl = max(0, min(ttl, exp - time.time()))
+
+    with _query_token_cache_lock:
+        if len(_query_token_cache) >= QUERY_TOKEN_CACHE_MAX:
+            now = time.monotonic()
+            for stale in [k for k, (e, _) in _query_token_cache.items() if e < now]:
+                del _query_token_cache[stale]
+        _query_token_cache[token] = (time.monotonic() + ttl, email)
+    return email
+
+
 def authenticate_with_query_token(
     token: str = None,
     db: Session = Depends(get_db)
 ):
     """Authenticate using token from query param (for iframe) or header."""
-    from fastapi.security.utils import get_authorization_scheme_param
-    from starlette.requests import Request
-    
     # Try to get token from query param first (for iframe)
     if token:
         try:
-            payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-            email: str = payload.get("sub")
-            if email is None:
-                raise HTTPException(status_code=401, detail="Invalid token")
+            email = _verify_query_token(token)
             user = db.query(models.User).filter(models.User.email == email).first()
             if user is None:
                 raise HTTPException(status_code=401, detail="User not found")
             return user
         except JWTError:
             raise HTTPException(status_code=401, detail="Could not validate credentials")
-    
+
     # Fall back to header authentication
     raise HTTPException(status_code=401, detail="Token required")
 
 
 @app.get("/resume/preview")
-def preview_resume(
+async def preview_resume(
     template: str = "modern",
     token: str = None,
     current_user: models.User = Depends(authenticate_with_query_token),
@@ -1184,36 +1635,18 @@ def preview_resume(
     if template not in resume_generator.TEMPLATES:
         template = "modern"
     
-    resume_data = {
-        'user_id': current_user.id,
-        'full_name': resume.full_name,
-        'email': resume.email,
-        'phone': resume.phone,
-        'location': resume.location,
-        'linkedin_url': resume.linkedin_url,
-        'portfolio_url': resume.portfolio_url,
-        'github_url': resume.github_url,
-        'twitter_url': resume.twitter_url,
-        'medium_url': resume.medium_url,
-        'dribbble_url': resume.dribbble_url,
-        'other_url': resume.other_url,
-        'summary': resume.summary,
-        'work_experience': resume.work_experience,
-        'education': resume.education,
-        'skills': resume.skills,
-        'certifications': resume.certifications,
-        'projects': resume.projects,
-        'languages': resume.languages,
-    }
+    resume_data = _resume_to_dict(resume, user_id=current_user.id)
     
     filename = f"preview_{current_user.username or 'user'}_{template}.pdf"
-    pdf_bytes = resume_generator.generate_pdf(resume_data, filename, template=template, return_bytes=True)
-    
-    from fastapi.responses import StreamingResponse
-    import io
-    
+    cache_key = _resume_render_key(resume_data, template, "pdf")
+    pdf_bytes = await _get_or_render_async(
+        current_user.id,
+        cache_key,
+        lambda: generate_pdf_async(resume_data, filename, template=template, return_bytes=True),
+    )
+
     return StreamingResponse(
-        io.BytesIO(pdf_bytes),
+        _iter_bytes(pdf_bytes),
         media_type="application/pdf",
         headers={
             "Content-Disposition": f"inline; filename={filename}",
@@ -1224,51 +1657,57 @@ def preview_resume(
     )
 
 
+# Serialized once at import; static payload
+_RESUME_TEMPLATES_JSON = orjson.dumps({
+    "templates": [
+        {"id": "modern", "name": "Modern ATS-Friendly", "description": "Clean, professional design with clear section headers. Best for tech and corporate roles."},
+        {"id": "classic", "name": "Classic Professional", "description": "Traditional serif fonts with elegant styling. Best for conservative industries."},
+        {"id": "minimal", "name": "Minimal Clean", "description": "Simple, whitespace-focused design. Best for creative and design roles."}
+    ]
+})
+
+
 @app.get("/resume/templates")
 def get_resume_templates():
     """Get available resume templates."""
-    return {
-        "templates": [
-            {"id": "modern", "name": "Modern ATS-Friendly", "description": "Clean, professional design with clear section headers. Best for tech and corporate roles."},
-            {"id": "classic", "name": "Classic Professional", "description": "Traditional serif fonts with elegant styling. Best for conservative industries."},
-            {"id": "minimal", "name": "Minimal Clean", "description": "Simple, whitespace-focused design. Best for creative and design roles."}
-        ]
-    }
+    return Response(content=_RESUME_TEMPLATES_JSON, media_type="application/json")
+
+
+# Last full ATS result (score/suggestions/keywords) per user. The
+# create/update endpoints compute it anyway, so the GET can serve it
+# without re-scanning every resume field; a cold hit (or force=true)
+# recomputes and refills.
+_ats_result_cache = {}
 
 
 @app.get("/resume/ats-score")
 def get_ats_score(
+    force: bool = False,
     current_user: models.User = Depends(authenticate),
     db: Session = Depends(get_db),
 ):
-    """Get ATS score and suggestions for resume."""
+    """Get ATS score and suggestions for resume.
+
+    Served from the result already computed on create/update; pass
+    force=true to recompute from the current row.
+    """
+    if not force:
+        cached = _ats_result_cache.get(current_user.id)
+        if cached is not None:
+            return cached
+
     resume = db.query(models.Resume).filter(models.Resume.user_id == current_user.id).first()
-    
+
     if not resume:
         raise HTTPException(status_code=404, detail="Resume not found")
-    
-    resume_data = {
-        'full_name': resume.full_name,
-        'email': resume.email,
-        'phone': resume.phone,
-        'location': resume.location,
-        'linkedin_url': resume.linkedin_url,
-        'portfolio_url': resume.portfolio_url,
-        'github_url': resume.github_url,
-        'twitter_url': resume.twitter_url,
-        'medium_url': resume.medium_url,
-        'dribbble_url': resume.dribbble_url,
-        'other_url': resume.other_url,
-        'summary': resume.summary,
-        'work_experience': resume.work_experience,
-        'education': resume.education,
-        'skills': resume.skills,
-        'certifications': resume.certifications,
-        'projects': resume.projects,
-        'languages': resume.languages,
-    }
-    
-    result = resume_generator.calculate_ats_score(resume_data)
+
+    result = resume_generator.calculate_ats_score(_resume_to_dict(resume))
+    _ats_result_cache[current_user.id] = result
+    if force:
+        # Persist the freshly computed values
+        resume.ats_score = result["score"]
+        resume.keywords = result["keywords"]
+        db.commit()
     return result
 
 
@@ -1278,8 +1717,23 @@ async def upload_resume_options():
     return {"message": "OK"}
 
 
+# Key fields that identify a duplicate per complex resume list
+_RESUME_MERGE_KEYS = {
+    "work_experience": ("title", "company"),
+    "education": ("degree", "institution"),
+    "projects": ("name",),
+    "certifications": ("name",),
+}
+
+
+MAX_RESUME_UPLOAD_BYTES = 20 * 1024 * 1024
+# Uploads up to this size stay in memory; larger ones spill to disk
+RESUME_UPLOAD_SPOOL_BYTES = 2 * 1024 * 1024
+
+
 @app.post("/resume/upload")
 async def upload_and_parse_resume(
+    request: Request,
     file: UploadFile = File(...),
     current_user: models.User = Depends(authenticate),
     db: Session = Depends(get_db),
@@ -1288,19 +1742,32 @@ async def upload_and_parse_resume(
     # Validate file type
     allowed_types = ['application/pdf', 'application/vnd.openxmlformats-officedocument.wordprocessingml.document']
     file_ext = file.filename.lower().split('.')[-1]
-    
+
     if file_ext not in ['pdf', 'docx']:
         raise HTTPException(
-            status_code=400, 
+            status_code=400,
             detail="Invalid file format. Only PDF and DOCX files are supported."
         )
-    
+
+    # Reject oversized uploads before reading the body
+    content_length = request.headers.get("content-length")
+    if content_length and int(content_length) > MAX_RESUME_UPLOAD_BYTES:
+        raise HTTPException(status_code=413, detail="Resume file too large (max 20 MB)")
+
     try:
-        # Read file content
-        content = await file.read()
-        
-        # Parse resume
-        result = resume_parser.parse_file(content, file.filename)
+        # Spool the upload to a temp file in 64 KB chunks instead of
+        # holding the whole document in memory
+        with tempfile.SpooledTemporaryFile(max_size=RESUME_UPLOAD_SPOOL_BYTES) as spooled:
+            total_bytes = 0
+            while chunk := await file.read(1 << 16):
+                total_bytes += len(chunk)
+                if total_bytes > MAX_RESUME_UPLOAD_BYTES:
+                    raise HTTPException(status_code=413, detail="Resume file too large (max 20 MB)")
+                spooled.write(chunk)
+            spooled.seek(0)
+
+            # Parse resume
+            result = resume_parser.parse_file_stream(spooled, file.filename)
         parsed_data = result["parsed_data"]
         ats_score = result["ats_score"]
         
@@ -1318,38 +1785,21 @@ async def upload_and_parse_resume(
                         existing_list = getattr(existing_resume, field) or []
                         
                         # Handle different list types appropriately
-                        if field in ['work_experience', 'education', 'projects', 'certifications']:
-                            # For complex objects, check if unique by key fields before adding
+                        if field in _RESUME_MERGE_KEYS:
+                            # Dedupe complex objects by their key fields with a
+                            # set: O(N+M) instead of comparing every pair
+                            key_fields = _RESUME_MERGE_KEYS[field]
+                            seen_keys = {
+                                tuple(item.get(k) for k in key_fields)
+                                for item in existing_list
+                                if isinstance(item, dict)
+                            }
                             merged_list = existing_list.copy()
                             for new_item in value:
                                 if isinstance(new_item, dict):
-                                    # Check if this item already exists (by comparing key fields)
-                                    is_duplicate = False
-                                    for existing_item in existing_list:
-                                        if isinstance(existing_item, dict):
-                                            # For work_experience, compare title + company
-                                            if field == 'work_experience':
-                                                if (new_item.get('title') == existing_item.get('title') and 
-                                                    new_item.get('company') == existing_item.get('company')):
-                                                    is_duplicate = True
-                                                    break
-                                            # For education, compare degree + institution
-                                            elif field == 'education':
-                                                if (new_item.get('degree') == existing_item.get('degree') and 
-                                                    new_item.get('institution') == existing_item.get('institution')):
-                                                    is_duplicate = True
-                                                    break
-                                            # For projects, compare name
-                                            elif field == 'projects':
-                                                if new_item.get('name') == existing_item.get('name'):
-                                                    is_duplicate = True
-                                                    break
-                                            # For certifications, compare name
-                                            elif field == 'certifications':
-                                                if new_item.get('name') == existing_item.get('name'):
-                                                    is_duplicate = True
-                                                    break
-                                    if not is_duplicate:
+                                    item_key = tuple(new_item.get(k) for k in key_fields)
+                                    if item_key not in seen_keys:
+                                        seen_keys.add(item_key)
                                         merged_list.append(new_item)
                                 else:
                                     # Simple string item
@@ -1405,14 +1855,20 @@ async def upload_and_parse_resume(
         
         db.commit()
         db.refresh(resume)
-        
+        _sync_resume_skills(db, resume.id, resume.skills)
+        invalidate_resume_render_cache(current_user.id)
+        # Parser computed its own score; drop any cached full result
+        _ats_result_cache.pop(current_user.id, None)
+
         return {
             "message": "Resume uploaded and parsed successfully",
             "parsed_data": parsed_data,
             "ats_score": ats_score,
             "resume_id": resume.id,
         }
-        
+
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Failed to parse resume: {str(e)}")
 
@@ -1433,7 +1889,7 @@ def create_company(
     if existing:
         raise HTTPException(status_code=400, detail="User already has a company profile")
     
-    company = models.Company(owner_id=current_user.id, **req.dict())
+    company = models.Company(owner_id=current_user.id, **req.model_dump())
     db.add(company)
     db.commit()
     db.refresh(company)
@@ -1445,13 +1901,25 @@ def create_company(
     return company
 
 
-@app.get("/companies/my", response_model=Optional[schemas.CompanyResponse])
-def get_my_company(
+def get_current_company(
     current_user: models.User = Depends(authenticate),
     db: Session = Depends(get_db),
+):
+    """The caller's company profile (or None).
+
+    FastAPI caches dependency results per request, so endpoints that
+    need the company share one SELECT instead of re-querying inline.
+    """
+    return db.query(models.Company).filter(
+        models.Company.owner_id == current_user.id
+    ).first()
+
+
+@app.get("/companies/my", response_model=Optional[schemas.CompanyResponse])
+def get_my_company(
+    company: Optional[models.Company] = Depends(get_current_company),
 ):
     """Get the current user's company."""
-    company = db.query(models.Company).filter(models.Company.owner_id == current_user.id).first()
     return company
 
 
@@ -1462,18 +1930,22 @@ def update_company(
     db: Session = Depends(get_db),
 ):
     """Update company profile."""
-    company = db.query(models.Company).filter(models.Company.owner_id == current_user.id).first()
-    
+    # Single UPDATE ... RETURNING instead of SELECT + mutate + refresh
+    update_data = req.model_dump(exclude_unset=True)
+    update_data["updated_at"] = datetime.utcnow()
+
+    company = db.execute(
+        update(models.Company)
+        .where(models.Company.owner_id == current_user.id)
+        .values(**update_data)
+        .returning(models.Company)
+    ).scalar_one_or_none()
+
     if not company:
+        db.rollback()
         raise HTTPException(status_code=404, detail="Company not found")
-    
-    update_data = req.dict(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(company, field, value)
-    
-    company.updated_at = datetime.utcnow()
+
     db.commit()
-    db.refresh(company)
     return company
 
 
@@ -1481,16 +1953,42 @@ def update_company(
 # Job Management
 # --------------------------------------------------
 
+# Compiled once; used for keyword extraction from job descriptions
+_KEYWORD_RE = re.compile(r"\b[A-Za-z]{4,}\b")
+
+# Column names captured once at import; the serializers below iterate
+# these instead of repeating 30-line dict literals per endpoint
+_JOB_COLUMNS = tuple(c.name for c in models.Job.__table__.columns)
+_COMPANY_COLUMNS = tuple(c.name for c in models.Company.__table__.columns)
+
+
+def _company_to_dict(company):
+    if company is None:
+        return None
+    data = {name: getattr(company, name) for name in _COMPANY_COLUMNS}
+    data["is_verified"] = bool(data["is_verified"])
+    return data
+
+
+def _job_to_dict(job, is_saved=False):
+    data = {name: getattr(job, name) for name in _JOB_COLUMNS}
+    data["is_remote"] = bool(data["is_remote"])
+    data["is_hybrid"] = bool(data["is_hybrid"])
+    data["external_id"] = None
+    data["source"] = "internal"
+    data["company"] = _company_to_dict(job.company)
+    data["is_saved"] = is_saved
+    return data
+
 @app.post("/jobs", response_model=schemas.JobResponse)
 def create_job(
     req: schemas.JobCreate,
     current_user: models.User = Depends(authenticate),
+    company: Optional[models.Company] = Depends(get_current_company),
     db: Session = Depends(get_db),
 ):
     """Post a new job."""
     # Check if user has a company
-    company = db.query(models.Company).filter(models.Company.owner_id == current_user.id).first()
-    
     if not company:
         raise HTTPException(status_code=400, detail="Create a company profile first")
     
@@ -1498,8 +1996,7 @@ def create_job(
     keywords = []
     if req.description:
         # Simple keyword extraction (in production, use NLP)
-        import re
-        words = re.findall(r'\b[A-Za-z]{4,}\b', req.description.lower())
+        words = _KEYWORD_RE.findall(req.description.lower())
         keywords = list(set(words))[:50]  # Top 50 keywords
     
     keywords.extend([s.lower() for s in req.required_skills])
@@ -1509,7 +2006,7 @@ def create_job(
         company_id=company.id,
         posted_by_id=current_user.id,
         keywords=list(set(keywords)),
-        **req.dict()
+        **req.model_dump()
     )
     db.add(job)
     db.commit()
@@ -1520,6 +2017,7 @@ def create_job(
 
 @app.get("/jobs")
 def search_jobs(
+    request: Request,
     query: Optional[str] = None,
     location: Optional[str] = None,
     is_remote: Optional[bool] = None,
@@ -1537,16 +2035,33 @@ def search_jobs(
     db: Session = Depends(get_db),
 ):
     """Search and filter jobs from both database and external sources."""
-    jobs_query = db.query(models.Job).filter(models.Job.status == "active")
+    # Eager-load company in one IN query; the response touches
+    # job.company.* for every row, which would otherwise be N+1 SELECTs
+    jobs_query = (
+        db.query(models.Job)
+        .options(selectinload(models.Job.company))
+        .filter(models.Job.status == "active")
+    )
     
     # Apply filters
     if query:
         search = f"%{query}%"
-        jobs_query = jobs_query.filter(
-            (models.Job.title.ilike(search)) |
-            (models.Job.description.ilike(search)) |
-            (models.Job.company.has(models.Company.name.ilike(search)))
-        )
+        if is_postgres:
+            # Word-stem full-text match on the generated GIN-indexed
+            # tsvector instead of seq-scanning the text blobs with ILIKE;
+            # company names keep the substring match
+            jobs_query = jobs_query.filter(or_(
+                text(
+                    "jobs.search_tsv @@ plainto_tsquery('english', :fts_query)"
+                ).bindparams(fts_query=query),
+                models.Job.company.has(models.Company.name.ilike(search)),
+            ))
+        else:
+            jobs_query = jobs_query.filter(
+                (models.Job.title.ilike(search)) |
+                (models.Job.description.ilike(search)) |
+                (models.Job.company.has(models.Company.name.ilike(search)))
+            )
     
     if location:
         jobs_query = jobs_query.filter(models.Job.location.ilike(f"%{location}%"))
@@ -1574,79 +2089,51 @@ def search_jobs(
     
     if skills:
         skill_list = [s.strip().lower() for s in skills.split(",")]
-        for skill in skill_list:
+        if is_postgres:
+            # One GIN-indexable ?& predicate over the concatenated skill
+            # arrays instead of N containment clauses; same all-skills
+            # semantics as the loop below
+            combined_skills = cast(models.Job.required_skills, JSONB).op("||")(
+                cast(models.Job.nice_to_have_skills, JSONB)
+            )
             jobs_query = jobs_query.filter(
-                models.Job.required_skills.contains([skill]) |
-                models.Job.nice_to_have_skills.contains([skill])
+                combined_skills.op("?&")(array(skill_list))
             )
+        else:
+            for skill in skill_list:
+                jobs_query = jobs_query.filter(
+                    models.Job.required_skills.contains([skill]) |
+                    models.Job.nice_to_have_skills.contains([skill])
+                )
     
     # Order by newest first
     jobs_query = jobs_query.order_by(models.Job.created_at.desc())
     
-    # Paginate
-    total = jobs_query.count()
-    jobs = jobs_query.offset((page - 1) * limit).limit(limit).all()
+    # Paginate: COUNT(*) OVER () returns the total with the page rows,
+    # one round-trip instead of a separate count query
+    rows = (
+        jobs_query.add_columns(func.count().over().label("total_count"))
+        .offset((page - 1) * limit)
+        .limit(limit)
+        .all()
+    )
+    jobs = [row[0] for row in rows]
+    if rows:
+        total = rows[0].total_count
+    elif page > 1:
+        # Page past the end: fall back to a count so total stays accurate
+        total = jobs_query.order_by(None).count()
+    else:
+        total = 0
     
-    # Check which jobs are saved by user
+    # Check which jobs are saved by user (id column only, not full rows)
     saved_job_ids = {
-        sj.job_id for sj in db.query(models.SavedJob).filter(
-            models.SavedJob.user_id == current_user.id
-        ).all()
+        job_id
+        for (job_id,) in db.query(models.SavedJob.job_id)
+        .filter(models.SavedJob.user_id == current_user.id)
+        .all()
     }
     
-    # Format response
-    results = []
-    for job in jobs:
-        job_dict = {
-            "id": job.id,
-            "external_id": None,
-            "source": "internal",
-            "company_id": job.company_id,
-            "posted_by_id": job.posted_by_id,
-            "title": job.title,
-            "description": job.description,
-            "requirements": job.requirements,
-            "responsibilities": job.responsibilities,
-            "employment_type": job.employment_type,
-            "experience_level": job.experience_level,
-            "category": job.category,
-            "location": job.location,
-            "is_remote": bool(job.is_remote),
-            "is_hybrid": bool(job.is_hybrid),
-            "salary_min": job.salary_min,
-            "salary_max": job.salary_max,
-            "salary_currency": job.salary_currency,
-            "salary_period": job.salary_period,
-            "required_skills": job.required_skills,
-            "nice_to_have_skills": job.nice_to_have_skills,
-            "keywords": job.keywords,
-            "status": job.status,
-            "application_url": job.application_url,
-            "application_email": job.application_email,
-            "views_count": job.views_count,
-            "applications_count": job.applications_count,
-            "created_at": job.created_at,
-            "updated_at": job.updated_at,
-            "company": {
-                "id": job.company.id,
-                "owner_id": job.company.owner_id,
-                "name": job.company.name,
-                "description": job.company.description,
-                "website": job.company.website,
-                "logo_url": job.company.logo_url,
-                "industry": job.company.industry,
-                "company_size": job.company.company_size,
-                "founded_year": job.company.founded_year,
-                "location": job.company.location,
-                "linkedin_url": job.company.linkedin_url,
-                "is_verified": bool(job.company.is_verified),
-                "created_at": job.company.created_at,
-                "updated_at": job.company.updated_at,
-            } if job.company else None,
-            "is_saved": job.id in saved_job_ids,
-        }
-        results.append(job_dict)
-    
     # Fetch external jobs if requested
     external_jobs = []
     if include_external:
@@ -1673,10 +2160,27 @@ def search_jobs(
         except Exception as e:
             # Log error but don't fail the request
             log.error(f"Failed to fetch external jobs: {e}")
-    
+
+    # NDJSON variant for large pages: one job per line, serialized as
+    # it's produced, so the client sees the first row before the whole
+    # page is encoded. The JSON shape below stays the default.
+    if "application/x-ndjson" in request.headers.get("accept", ""):
+        def _iter_ndjson():
+            for job in jobs:
+                yield orjson.dumps(
+                    _job_to_dict(job, is_saved=job.id in saved_job_ids)
+                ) + b"\n"
+            for ext_job in external_jobs:
+                yield orjson.dumps(ext_job, default=str) + b"\n"
+
+        return StreamingResponse(_iter_ndjson(), media_type="application/x-ndjson")
+
+    # Format response
+    results = [_job_to_dict(job, is_saved=job.id in saved_job_ids) for job in jobs]
+
     # Combine results
     all_jobs = results + external_jobs
-    
+
     return {
         "jobs": all_jobs,
         "total": total + len(external_jobs),
@@ -1689,92 +2193,377 @@ def search_jobs(
     }
 
 
-@app.get("/jobs/{job_id}")
-def get_job(
-    job_id: str,
+# External job ids look like "<source>_<original_id>"; the templates map
+# a known source to its public job-details URL
+SOURCE_URL_TEMPLATES = {
+    "jooble": "https://jooble.org/jdp/{}",
+    "adzuna": "https://www.adzuna.in/details/{}",
+}
+
+JobIdInfo = namedtuple("JobIdInfo", ["is_external", "source", "original_id"])
+
+# External-job responses are deterministic given the job id (everything
+# but is_saved), so the serialized blob is cached in Redis when
+# REDIS_URL is configured; without Redis the dict is simply rebuilt.
+EXTERNAL_JOB_CACHE_TTL = 3600  # seconds
+
+try:
+    _extjob_redis = redis.Redis.from_url(os.environ["REDIS_URL"]) if os.getenv("REDIS_URL") else None
+except Exception as e:
+    log.error(f"External-job cache disabled, Redis unavailable: {e}")
+    _extjob_redis = None
+
+# The external-job payload is all placeholders; build the constant keys
+# once at import (the timestamps are placeholders too, so a module-load
+# value is as meaningful as a per-request utcnow and costs nothing)
+_EXTJOB_PLACEHOLDER_TS = datetime.utcnow().isoformat()
+
+_EXTERNAL_JOB_TEMPLATE = {
+    "company_id": None,
+    "posted_by_id": None,
+    "title": "External Job",
+    "description": "This is an external job posting. Click Apply to view the full details and apply on the external site.",
+    "requirements": "",
+    "responsibilities": "",
+    "employment_type": "full-time",
+    "experience_level": "mid",
+    "category": "Other",
+    "location": "Remote",
+    "is_remote": True,
+    "is_hybrid": False,
+    "salary_min": None,
+    "salary_max": None,
+    "salary_currency": "USD",
+    "salary_period": "yearly",
+    "required_skills": [],
+    "nice_to_have_skills": [],
+    "keywords": [],
+    "status": "active",
+    "application_email": None,
+    "views_count": 0,
+    "applications_count": 0,
+    "created_at": _EXTJOB_PLACEHOLDER_TS,
+    "updated_at": _EXTJOB_PLACEHOLDER_TS,
+    "company": None,
+}
+
+
+def _classify_job_id(job_id: str) -> JobIdInfo:
+    """Parse a path job id once instead of re-splitting it per endpoint."""
+    if "_" in job_id:
+        source, original_id = job_id.split("_", 1)
+        return JobIdInfo(True, source, original_id)
+    if not job_id.isdigit():
+        return JobIdInfo(True, "external", job_id)
+    return JobIdInfo(False, "internal", job_id)
+
+
+def _external_application_url(job_id: str, info: JobIdInfo) -> str:
+    template = SOURCE_URL_TEMPLATES.get(info.source)
+    if template:
+        return template.format(info.original_id)
+    return f"https://www.google.com/search?q={job_id}"
+
+
+# --------------------------------------------------
+# Job Recommendations (For Candidates)
+# --------------------------------------------------
+
+@app.get("/jobs/recommended")
+def get_recommended_jobs(
+    limit: int = 10,
     current_user: models.User = Depends(authenticate),
     db: Session = Depends(get_db),
 ):
-    """Get a specific job."""
-    # Check if it's an external job (contains underscore or non-numeric characters)
-    if '_' in job_id or not job_id.isdigit():
-        # Parse external job ID to get source and original ID
-        if '_' in job_id:
-            parts = job_id.split('_', 1)
-            source = parts[0]  # e.g., "jooble", "adzuna"
-            original_id = parts[1]  # e.g., "-3698814023299470456"
-        else:
-            source = "external"
-            original_id = job_id
+    """Get job recommendations based on resume."""
+    try:
+        resume = db.query(models.Resume).filter(models.Resume.user_id == current_user.id).first()
+        
+        if not resume:
+            # Return recent jobs if no resume (company eager-loaded for
+            # the response formatting)
+            jobs = (
+                db.query(models.Job)
+                .options(selectinload(models.Job.company))
+                .filter(models.Job.status == "active")
+                .order_by(models.Job.created_at.desc())
+                .limit(limit)
+                .all()
+            )
+            
+            # Format jobs for response
+            results = []
+            for job in jobs:
+                results.append({
+                    "id": job.id,
+                    "title": job.title,
+                    "company": {
+                        "id": job.company.id if job.company else None,
+                        "name": job.company.name if job.company else "Unknown Company",
+                        "logo_url": job.company.logo_url if job.company else None,
+                    } if job.company else {"name": "Unknown Company"},
+                    "location": job.location,
+                    "is_remote": bool(job.is_remote),
+                    "employment_type": job.employment_type,
+                    "salary_min": job.salary_min,
+                    "salary_max": job.salary_max,
+                    "required_skills": job.required_skills,
+                    "match_score": None,
+                    "matching_skills": [],
+                    "match_reasons": [],
+                })
+            
+            return {"jobs": results, "source": "recent"}
         
-        # Try to fetch fresh details from external API
-        external_job_data = None
+        resume_data = {
+            'skills': resume.skills or [],
+            # Normalized at write time; no per-request ast parsing
+            'work_experience': resume.work_experience or [],
+            'preferred_location': resume.preferred_location or '',
+            'remote_preference': resume.remote_preference or 'any',
+            'keywords': resume.keywords or [],
+        }
+
+        # Get active jobs, prefiltered in SQL to those sharing at least
+        # one skill with the resume (same element-wise ILIKE expansion
+        # the candidate matcher uses) - scoring zero-overlap jobs is
+        # wasted Python work
+        # company is eager-loaded because the top-K formatting loop reads
+        # job.company.* per returned row - one IN query instead of K lazy
+        # SELECTs
+        jobs_query = (
+            db.query(models.Job)
+            .options(selectinload(models.Job.company))
+            .filter(models.Job.status == "active")
+        )
+        resume_skills = resume.skills or []
+        if resume_skills:
+            predicates = []
+            for skill in resume_skills[:50]:
+                for form in skill_match_forms(skill):
+                    pattern = f'%"{form}"%'
+                    predicates.append(cast(models.Job.required_skills, String).ilike(pattern))
+                    predicates.append(cast(models.Job.nice_to_have_skills, String).ilike(pattern))
+            jobs_query = jobs_query.filter(or_(*predicates))
+        jobs = jobs_query.all()
+
+        # Niche resumes can prefilter below the page size; top up with
+        # recent actives so the panel never comes back empty
+        if len(jobs) < limit:
+            seen_ids = {job.id for job in jobs}
+            jobs.extend(
+                job for job in (
+                    db.query(models.Job)
+                    .options(selectinload(models.Job.company))
+                    .filter(models.Job.status == "active")
+                    .order_by(models.Job.created_at.desc())
+                    .limit(limit + len(seen_ids))
+                    .all()
+                )
+                if job.id not in seen_ids
+            )
+
+        job_datas = [
+            {
+                'title': job.title or '',
+                'description': job.description or '',
+                'required_skills': job.required_skills or [],
+                'nice_to_have_skills': job.nice_to_have_skills or [],
+                'experience_level': job.experience_level or '',
+                'location': job.location or '',
+                'is_remote': bool(job.is_remote),
+                'is_hybrid': bool(job.is_hybrid),
+                'keywords': job.keywords or [],
+            }
+            for job in jobs
+        ]
+
+        # Score and rank; large job sets fan out over the matcher's
+        # process pool, small ones score in-process
+        scored_jobs = []
         try:
-            if source == "jooble" and job_fetcher.jooble_api_key:
-                # Jooble doesn't have a single job fetch API, but we can construct the URL
-                external_job_data = {
-                    "application_url": f"https://jooble.org/jdp/{original_id}",
-                    "external_source": "jooble",
-                }
-            elif source == "adzuna":
-                # Adzuna jobs have redirect URLs
-                external_job_data = {
-                    "application_url": f"https://www.adzuna.in/details/{original_id}",
-                    "external_source": "adzuna",
-                }
+            match_results = _cached_score_jobs(resume_data, job_datas)
+            for job, match_result in zip(jobs, match_results):
+                scored_jobs.append({
+                    "job": job,
+                    "match_score": match_result.score,
+                    "matching_skills": match_result.matching_skills,
+                    "match_reasons": match_result.reasons,
+                })
         except Exception as e:
-            log.error(f"Failed to fetch external job details: {e}")
+            log.error(f"Error scoring recommendations: {e}")
+            # Degrade to unranked results rather than failing the request
+            scored_jobs = [
+                {
+                    "job": job,
+                    "match_score": 0,
+                    "matching_skills": [],
+                    "match_reasons": [],
+                }
+                for job in jobs
+            ]
         
-        # Check if user has saved this job (external job)
-        is_saved = db.query(models.SavedJob).filter(
-            models.SavedJob.user_id == current_user.id,
-            models.SavedJob.external_job_id == job_id
-        ).first() is not None
+        # Top-K selection: O(N log limit) instead of sorting all N
+        top_jobs = heapq.nlargest(limit, scored_jobs, key=lambda x: x["match_score"])
+
+        # Format response
+        results = []
+        for item in top_jobs:
+            try:
+                job = item["job"]
+                results.append({
+                    "id": job.id,
+                    "title": job.title,
+                    "company": {
+                        "id": job.company.id if job.company else None,
+                        "name": job.company.name if job.company else "Unknown Company",
+                        "logo_url": job.company.logo_url if job.company else None,
+                    } if job.company else {"name": "Unknown Company"},
+                    "location": job.location,
+                    "is_remote": bool(job.is_remote),
+                    "employment_type": job.employment_type,
+                    "salary_min": job.salary_min,
+                    "salary_max": job.salary_max,
+                    "required_skills": job.required_skills,
+                    "match_score": round(item["match_score"]),
+                    "matching_skills": item["matching_skills"],
+                    "match_reasons": item["match_reasons"],
+                })
+            except Exception as e:
+                log.error(f"Error formatting job result: {e}")
+                continue
         
-        # Build the correct application URL
-        if external_job_data and external_job_data.get("application_url"):
-            application_url = external_job_data["application_url"]
-        elif source == "jooble":
-            application_url = f"https://jooble.org/jdp/{original_id}"
-        elif source == "adzuna":
-            application_url = f"https://www.adzuna.in/details/{original_id}"
+        return {"jobs": results, "source": "matched"}
+    except Exception as e:
+        log.error(f"Error in get_recommended_jobs: {e}")
+        raise HTTPException(status_code=500, detail=f"Failed to get recommendations: {str(e)}")
+
+
+@app.get("/jobs/saved")
+@app.get("/jobs/saved/list")  # Keep both endpoints for compatibility
+def get_saved_jobs(
+    current_user: models.User = Depends(authenticate),
+    db: Session = Depends(get_db),
+):
+    """Get all saved jobs for the current user (both internal and external)."""
+    # Eager-load job -> company; the response walks both per saved row
+    saved = (
+        db.query(models.SavedJob)
+        .options(selectinload(models.SavedJob.job).joinedload(models.Job.company))
+        .filter(models.SavedJob.user_id == current_user.id)
+        .order_by(models.SavedJob.created_at.desc())
+        .all()
+    )
+    
+    results = []
+    for sj in saved:
+        # Handle external jobs (stored flag; no string sniffing)
+        if sj.is_external:
+            job_data = sj.job_data or {}
+            
+            # Build application URL based on source
+            template = SOURCE_URL_TEMPLATES.get(sj.job_source)
+            if template:
+                original_id = sj.external_job_id.replace(f"{sj.job_source}_", "")
+                application_url = template.format(original_id)
+            else:
+                application_url = job_data.get("application_url", "")
+            
+            job_dict = {
+                "id": sj.external_job_id,
+                "saved_id": sj.id,
+                "user_id": sj.user_id,
+                "job_id": None,
+                "external_job_id": sj.external_job_id,
+                "job_source": sj.job_source,
+                "created_at": sj.created_at,
+                "job": {
+                    "id": sj.external_job_id,
+                    "external_id": sj.external_job_id,
+                    "source": sj.job_source,
+                    "title": job_data.get("title", "External Job"),
+                    "company": {
+                        "name": job_data.get("company_name", "Unknown Company"),
+                    },
+                    "location": job_data.get("location", "Remote"),
+                    "is_remote": job_data.get("is_remote", True),
+                    "employment_type": job_data.get("employment_type", "full-time"),
+                    "salary_min": job_data.get("salary_min"),
+                    "salary_max": job_data.get("salary_max"),
+                    "salary_currency": job_data.get("salary_currency", "USD"),
+                    "required_skills": job_data.get("required_skills", []),
+                    "application_url": application_url,
+                    "is_saved": True,
+                }
+            }
         else:
-            application_url = f"https://www.google.com/search?q={job_id}"
-        
-        # Return external job structure with correct URL
-        return {
-            "id": job_id,
-            "external_id": job_id,
-            "source": source,
-            "company_id": None,
-            "posted_by_id": None,
-            "title": "External Job",
-            "description": "This is an external job posting. Click Apply to view the full details and apply on the external site.",
-            "requirements": "",
-            "responsibilities": "",
-            "employment_type": "full-time",
-            "experience_level": "mid",
-            "category": "Other",
-            "location": "Remote",
-            "is_remote": True,
-            "is_hybrid": False,
-            "salary_min": None,
-            "salary_max": None,
-            "salary_currency": "USD",
-            "salary_period": "yearly",
-            "required_skills": [],
-            "nice_to_have_skills": [],
-            "keywords": [],
-            "status": "active",
-            "application_url": application_url,
-            "application_email": None,
-            "views_count": 0,
-            "applications_count": 0,
-            "created_at": datetime.utcnow().isoformat(),
-            "updated_at": datetime.utcnow().isoformat(),
-            "company": None,
-            "is_saved": is_saved,
-        }
+            # Internal job - same column-driven serializer as /jobs
+            job_dict = {
+                "id": sj.job_id,
+                "saved_id": sj.id,
+                "user_id": sj.user_id,
+                "job_id": sj.job_id,
+                "external_job_id": None,
+                "job_source": "internal",
+                "created_at": sj.created_at,
+                "job": _job_to_dict(sj.job, is_saved=True),
+            }
+        results.append(job_dict)
+
+    return results
+
+
+@app.get("/jobs/{job_id}")
+def get_job(
+    job_id: str,
+    current_user: models.User = Depends(authenticate),
+    db: Session = Depends(get_db),
+):
+    """Get a specific job."""
+    info = _classify_job_id(job_id)
+    if info.is_external:
+        # Check if user has saved this job (external job); SELECT EXISTS
+        # lets the planner stop at the first match
+        is_saved = db.query(
+            db.query(models.SavedJob.id)
+            .filter(
+                models.SavedJob.user_id == current_user.id,
+                models.SavedJob.external_job_id == job_id,
+            )
+            .exists()
+        ).scalar()
+
+        # The static portion is deterministic per job id; serve it from
+        # Redis when available and merge the per-user is_saved flag in
+        cached = None
+        if _extjob_redis is not None:
+            try:
+                cached = _extjob_redis.get(f"extjob:{job_id}")
+            except Exception as e:
+                log.error(f"External-job cache read failed: {e}")
+
+        if cached is not None:
+            job_dict = orjson.loads(cached)
+        else:
+            # Copy the constant template and fill the per-id fields
+            job_dict = dict(_EXTERNAL_JOB_TEMPLATE)
+            job_dict.update(
+                id=job_id,
+                external_id=job_id,
+                source=info.source,
+                application_url=_external_application_url(job_id, info),
+            )
+            if _extjob_redis is not None:
+                try:
+                    _extjob_redis.set(
+                        f"extjob:{job_id}", orjson.dumps(job_dict),
+                        ex=EXTERNAL_JOB_CACHE_TTL,
+                    )
+                except Exception as e:
+                    log.error(f"External-job cache write failed: {e}")
+
+        job_dict["is_saved"] = is_saved
+        return job_dict
     
     # Internal job - parse as int
     job = db.query(models.Job).filter(models.Job.id == int(job_id)).first()
@@ -1782,10 +2571,11 @@ def get_job(
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
     
-    # Increment view count
-    job.views_count += 1
-    db.commit()
-    
+    # Increment view count (flushed in batches by the background flusher;
+    # no per-read write transaction, and the instance stays unexpired for
+    # serialization)
+    buffer_job_view(job.id)
+
     return job
 
 
@@ -1806,7 +2596,7 @@ def update_job(
     if job.posted_by_id != current_user.id:
         raise HTTPException(status_code=403, detail="Not authorized to update this job")
     
-    update_data = req.dict(exclude_unset=True)
+    update_data = req.model_dump(exclude_unset=True)
     for field, value in update_data.items():
         setattr(job, field, value)
     
@@ -1859,68 +2649,63 @@ def save_job(
     db: Session = Depends(get_db),
 ):
     """Save a job for later. Supports both internal (int) and external (string) job IDs."""
-    
-    # Check if it's an external job
-    is_external = '_' in job_id or not job_id.isdigit()
-    
-    if is_external:
-        # External job - parse source and ID
-        if '_' in job_id:
-            parts = job_id.split('_', 1)
-            source = parts[0]  # "jooble", "adzuna"
-            external_id = job_id  # full ID like "jooble_123"
-        else:
-            source = "external"
-            external_id = job_id
-        
-        # Check if already saved
-        existing = db.query(models.SavedJob).filter(
-            models.SavedJob.user_id == current_user.id,
-            models.SavedJob.external_job_id == external_id
-        ).first()
-        
-        if existing:
-            raise HTTPException(status_code=400, detail="Job already saved")
-        
-        # Create saved job entry for external job
-        saved = models.SavedJob(
-            user_id=current_user.id,
-            job_id=None,
-            external_job_id=external_id,
-            job_source=source,
-            job_data={}  # Could store job details here if needed
+
+    info = _classify_job_id(job_id)
+
+    if info.is_external:
+        source = info.source
+        external_id = job_id  # full ID like "jooble_123"
+
+        # Single INSERT ... ON CONFLICT DO NOTHING: the unique constraint
+        # does the already-saved check, no separate SELECT round-trip
+        result = db.execute(
+            dialect_insert(models.SavedJob)
+            .values(
+                user_id=current_user.id,
+                job_id=None,
+                external_job_id=external_id,
+                job_source=source,
+                is_external=True,
+                job_data={},  # Could store job details here if needed
+            )
+            .on_conflict_do_nothing(index_elements=["user_id", "external_job_id"])
         )
-        db.add(saved)
         db.commit()
-        
+
+        if result.rowcount == 0:
+            raise HTTPException(status_code=400, detail="Job already saved")
+
         return {"message": "Job saved successfully"}
     else:
         # Internal job
         internal_job_id = int(job_id)
         
         # Check if job exists
-        job = db.query(models.Job).filter(models.Job.id == internal_job_id).first()
-        if not job:
+        job_exists = db.query(
+            db.query(models.Job.id).filter(models.Job.id == internal_job_id).exists()
+        ).scalar()
+        if not job_exists:
             raise HTTPException(status_code=404, detail="Job not found")
-        
-        # Check if already saved
-        existing = db.query(models.SavedJob).filter(
-            models.SavedJob.user_id == current_user.id,
-            models.SavedJob.job_id == internal_job_id
-        ).first()
-        
-        if existing:
-            raise HTTPException(status_code=400, detail="Job already saved")
-        
-        saved = models.SavedJob(
-            user_id=current_user.id,
-            job_id=internal_job_id,
-            external_job_id=None,
-            job_source="internal"
+
+        # Single INSERT ... ON CONFLICT DO NOTHING against the
+        # (user_id, job_id) unique constraint
+        result = db.execute(
+            dialect_insert(models.SavedJob)
+            .values(
+                user_id=current_user.id,
+                job_id=internal_job_id,
+                external_job_id=None,
+                job_source="internal",
+                is_external=False,
+                job_data={},
+            )
+            .on_conflict_do_nothing(index_elements=["user_id", "job_id"])
         )
-        db.add(saved)
         db.commit()
-        
+
+        if result.rowcount == 0:
+            raise HTTPException(status_code=400, detail="Job already saved")
+
         return {"message": "Job saved successfully"}
 
 
@@ -1931,158 +2716,37 @@ def unsave_job(
     db: Session = Depends(get_db),
 ):
     """Remove a saved job. Supports both internal (int) and external (string) job IDs."""
-    
-    # Check if it's an external job
-    is_external = '_' in job_id or not job_id.isdigit()
-    
-    if is_external:
+
+    if _classify_job_id(job_id).is_external:
         # External job
         saved = db.query(models.SavedJob).filter(
             models.SavedJob.user_id == current_user.id,
             models.SavedJob.external_job_id == job_id
         ).first()
-        
-        if not saved:
-            raise HTTPException(status_code=404, detail="Saved job not found")
-        
-        db.delete(saved)
-        db.commit()
-        
-        return {"message": "Job removed from saved"}
-    else:
-        # Internal job
-        internal_job_id = int(job_id)
-        
-        saved = db.query(models.SavedJob).filter(
-            models.SavedJob.user_id == current_user.id,
-            models.SavedJob.job_id == internal_job_id
-        ).first()
-        
-        if not saved:
-            raise HTTPException(status_code=404, detail="Saved job not found")
-        
-        db.delete(saved)
-        db.commit()
-        
-        return {"message": "Job removed from saved"}
-
-
-@app.get("/jobs/saved")
-@app.get("/jobs/saved/list")  # Keep both endpoints for compatibility
-def get_saved_jobs(
-    current_user: models.User = Depends(authenticate),
-    db: Session = Depends(get_db),
-):
-    """Get all saved jobs for the current user (both internal and external)."""
-    saved = db.query(models.SavedJob).filter(
-        models.SavedJob.user_id == current_user.id
-    ).order_by(models.SavedJob.created_at.desc()).all()
-    
-    results = []
-    for sj in saved:
-        # Handle external jobs
-        if sj.external_job_id:
-            job_data = sj.job_data or {}
-            
-            # Build application URL based on source
-            if sj.job_source == "jooble":
-                original_id = sj.external_job_id.replace("jooble_", "")
-                application_url = f"https://jooble.org/jdp/{original_id}"
-            elif sj.job_source == "adzuna":
-                original_id = sj.external_job_id.replace("adzuna_", "")
-                application_url = f"https://www.adzuna.in/details/{original_id}"
-            else:
-                application_url = job_data.get("application_url", "")
-            
-            job_dict = {
-                "id": sj.external_job_id,
-                "saved_id": sj.id,
-                "user_id": sj.user_id,
-                "job_id": None,
-                "external_job_id": sj.external_job_id,
-                "job_source": sj.job_source,
-                "created_at": sj.created_at,
-                "job": {
-                    "id": sj.external_job_id,
-                    "external_id": sj.external_job_id,
-                    "source": sj.job_source,
-                    "title": job_data.get("title", "External Job"),
-                    "company": {
-                        "name": job_data.get("company_name", "Unknown Company"),
-                    },
-                    "location": job_data.get("location", "Remote"),
-                    "is_remote": job_data.get("is_remote", True),
-                    "employment_type": job_data.get("employment_type", "full-time"),
-                    "salary_min": job_data.get("salary_min"),
-                    "salary_max": job_data.get("salary_max"),
-                    "salary_currency": job_data.get("salary_currency", "USD"),
-                    "required_skills": job_data.get("required_skills", []),
-                    "application_url": application_url,
-                    "is_saved": True,
-                }
-            }
-        else:
-            # Internal job
-            job_dict = {
-                "id": sj.job_id,
-                "saved_id": sj.id,
-                "user_id": sj.user_id,
-                "job_id": sj.job_id,
-                "external_job_id": None,
-                "job_source": "internal",
-                "created_at": sj.created_at,
-                "job": {
-                    "id": sj.job.id,
-                    "external_id": None,
-                    "source": "internal",
-                    "company_id": sj.job.company_id,
-                    "posted_by_id": sj.job.posted_by_id,
-                    "title": sj.job.title,
-                    "description": sj.job.description,
-                    "requirements": sj.job.requirements,
-                    "responsibilities": sj.job.responsibilities,
-                    "employment_type": sj.job.employment_type,
-                    "experience_level": sj.job.experience_level,
-                    "category": sj.job.category,
-                    "location": sj.job.location,
-                    "is_remote": bool(sj.job.is_remote),
-                    "is_hybrid": bool(sj.job.is_hybrid),
-                    "salary_min": sj.job.salary_min,
-                    "salary_max": sj.job.salary_max,
-                    "salary_currency": sj.job.salary_currency,
-                    "salary_period": sj.job.salary_period,
-                    "required_skills": sj.job.required_skills,
-                    "nice_to_have_skills": sj.job.nice_to_have_skills,
-                    "keywords": sj.job.keywords,
-                    "status": sj.job.status,
-                    "application_url": sj.job.application_url,
-                    "application_email": sj.job.application_email,
-                    "views_count": sj.job.views_count,
-                    "applications_count": sj.job.applications_count,
-                    "created_at": sj.job.created_at,
-                    "updated_at": sj.job.updated_at,
-                    "company": {
-                        "id": sj.job.company.id if sj.job.company else None,
-                        "owner_id": sj.job.company.owner_id if sj.job.company else None,
-                        "name": sj.job.company.name if sj.job.company else "Unknown Company",
-                        "description": sj.job.company.description if sj.job.company else None,
-                        "website": sj.job.company.website if sj.job.company else None,
-                        "logo_url": sj.job.company.logo_url if sj.job.company else None,
-                        "industry": sj.job.company.industry if sj.job.company else None,
-                        "company_size": sj.job.company.company_size if sj.job.company else None,
-                        "founded_year": sj.job.company.founded_year if sj.job.company else None,
-                        "location": sj.job.company.location if sj.job.company else None,
-                        "linkedin_url": sj.job.company.linkedin_url if sj.job.company else None,
-                        "is_verified": bool(sj.job.company.is_verified) if sj.job.company else False,
-                        "created_at": sj.job.company.created_at if sj.job.company else None,
-                        "updated_at": sj.job.company.updated_at if sj.job.company else None,
-                    },
-                    "is_saved": True,
-                }
-            }
-        results.append(job_dict)
-    
-    return results
+        
+        if not saved:
+            raise HTTPException(status_code=404, detail="Saved job not found")
+        
+        db.delete(saved)
+        db.commit()
+        
+        return {"message": "Job removed from saved"}
+    else:
+        # Internal job
+        internal_job_id = int(job_id)
+        
+        saved = db.query(models.SavedJob).filter(
+            models.SavedJob.user_id == current_user.id,
+            models.SavedJob.job_id == internal_job_id
+        ).first()
+        
+        if not saved:
+            raise HTTPException(status_code=404, detail="Saved job not found")
+        
+        db.delete(saved)
+        db.commit()
+        
+        return {"message": "Job removed from saved"}
 
 
 # --------------------------------------------------
@@ -2140,28 +2804,37 @@ def apply_to_job(
         'keywords': job.keywords,
     }
     
-    match_result = matcher.calculate_match(resume_data, job_data)
-    
-    application = models.JobApplication(
-        job_id=req.job_id,
-        candidate_id=current_user.id,
-        resume_id=resume.id,
-        cover_letter=req.cover_letter,
-        custom_answers=req.custom_answers,
-        match_score=match_result.score,
-        match_reasons=match_result.reasons
+    match_result = _cached_calculate_match(resume_data, job_data)
+
+    # Core INSERT ... RETURNING id plus a relative counter UPDATE in the
+    # same transaction: no ORM flush bookkeeping and no refresh SELECT
+    application_id = db.execute(
+        dialect_insert(models.JobApplication)
+        .values(
+            job_id=req.job_id,
+            candidate_id=current_user.id,
+            resume_id=resume.id,
+            cover_letter=req.cover_letter,
+            custom_answers=req.custom_answers,
+            match_score=match_result.score,
+            match_reasons=match_result.reasons,
+        )
+        .returning(models.JobApplication.id)
+    ).scalar_one()
+
+    # Increment job application count without dirtying the loaded row
+    db.execute(
+        update(models.Job)
+        .where(models.Job.id == req.job_id)
+        .values(applications_count=models.Job.applications_count + 1)
+        .execution_options(synchronize_session=False)
     )
-    db.add(application)
-    
-    # Increment job application count
-    job.applications_count += 1
-    
+
     db.commit()
-    db.refresh(application)
-    
+
     return {
         "message": "Application submitted successfully",
-        "application_id": application.id,
+        "application_id": application_id,
         "match_score": match_result.score,
         "match_reasons": match_result.reasons
     }
@@ -2173,9 +2846,14 @@ def get_my_applications(
     db: Session = Depends(get_db),
 ):
     """Get all applications submitted by the current user."""
-    applications = db.query(models.JobApplication).filter(
-        models.JobApplication.candidate_id == current_user.id
-    ).order_by(models.JobApplication.applied_at.desc()).all()
+    # Eager-load job -> company; the response walks both per application
+    applications = (
+        db.query(models.JobApplication)
+        .options(joinedload(models.JobApplication.job).joinedload(models.Job.company))
+        .filter(models.JobApplication.candidate_id == current_user.id)
+        .order_by(models.JobApplication.applied_at.desc())
+        .all()
+    )
     
     results = []
     for app in applications:
@@ -2211,66 +2889,86 @@ def get_received_applications(
     job_id: Optional[int] = None,
     status: Optional[str] = None,
     current_user: models.User = Depends(authenticate),
+    company: Optional[models.Company] = Depends(get_current_company),
     db: Session = Depends(get_db),
 ):
     """Get applications received for jobs posted by the user (recruiter view)."""
-    # Get user's company
-    company = db.query(models.Company).filter(models.Company.owner_id == current_user.id).first()
-    
     if not company:
         raise HTTPException(status_code=400, detail="No company profile found")
     
-    # Get applications for jobs from this company
-    query = db.query(models.JobApplication).join(models.Job).filter(
-        models.Job.company_id == company.id
+    # One joined columnar query: the response plucks ~20 scalar fields,
+    # so lightweight Row tuples beat hydrating four ORM objects per
+    # application (and cover the resume in the same round-trip)
+    query = (
+        db.query(
+            models.JobApplication.id,
+            models.JobApplication.job_id,
+            models.JobApplication.candidate_id,
+            models.JobApplication.resume_id,
+            models.JobApplication.status,
+            models.JobApplication.match_score,
+            models.JobApplication.match_reasons,
+            models.JobApplication.applied_at,
+            models.JobApplication.reviewed_at,
+            models.JobApplication.notes,
+            models.Job.title.label("job_title"),
+            models.User.username.label("candidate_username"),
+            models.User.email.label("candidate_email"),
+            models.Resume.full_name.label("resume_full_name"),
+            models.Resume.email.label("resume_email"),
+            models.Resume.phone.label("resume_phone"),
+            models.Resume.location.label("resume_location"),
+            models.Resume.skills.label("resume_skills"),
+            models.Resume.ats_score.label("resume_ats_score"),
+            models.Resume.pdf_url.label("resume_pdf_url"),
+        )
+        .join(models.Job, models.JobApplication.job_id == models.Job.id)
+        .join(models.User, models.JobApplication.candidate_id == models.User.id)
+        .outerjoin(models.Resume, models.Resume.user_id == models.JobApplication.candidate_id)
+        .filter(models.Job.company_id == company.id)
     )
-    
+
     if job_id:
         query = query.filter(models.JobApplication.job_id == job_id)
-    
+
     if status:
         query = query.filter(models.JobApplication.status == status)
-    
-    applications = query.order_by(models.JobApplication.applied_at.desc()).all()
-    
-    results = []
-    for app in applications:
-        candidate_resume = db.query(models.Resume).filter(
-            models.Resume.user_id == app.candidate_id
-        ).first()
-        
-        results.append({
-            "id": app.id,
-            "job_id": app.job_id,
-            "candidate_id": app.candidate_id,
-            "resume_id": app.resume_id,
-            "status": app.status,
-            "match_score": app.match_score,
-            "match_reasons": app.match_reasons,
-            "applied_at": app.applied_at,
-            "reviewed_at": app.reviewed_at,
-            "notes": app.notes,
+
+    rows = query.order_by(models.JobApplication.applied_at.desc()).all()
+
+    return [
+        {
+            "id": row.id,
+            "job_id": row.job_id,
+            "candidate_id": row.candidate_id,
+            "resume_id": row.resume_id,
+            "status": row.status,
+            "match_score": row.match_score,
+            "match_reasons": row.match_reasons,
+            "applied_at": row.applied_at,
+            "reviewed_at": row.reviewed_at,
+            "notes": row.notes,
             "job": {
-                "id": app.job.id,
-                "title": app.job.title,
+                "id": row.job_id,
+                "title": row.job_title,
             },
             "candidate": {
-                "id": app.candidate.id,
-                "username": app.candidate.username,
-                "email": app.candidate.email,
+                "id": row.candidate_id,
+                "username": row.candidate_username,
+                "email": row.candidate_email,
                 "resume": {
-                    "full_name": candidate_resume.full_name if candidate_resume else None,
-                    "email": candidate_resume.email if candidate_resume else None,
-                    "phone": candidate_resume.phone if candidate_resume else None,
-                    "location": candidate_resume.location if candidate_resume else None,
-                    "skills": candidate_resume.skills if candidate_resume else [],
-                    "ats_score": candidate_resume.ats_score if candidate_resume else 0,
-                    "pdf_url": candidate_resume.pdf_url if candidate_resume else None,
+                    "full_name": row.resume_full_name,
+                    "email": row.resume_email,
+                    "phone": row.resume_phone,
+                    "location": row.resume_location,
+                    "skills": row.resume_skills or [],
+                    "ats_score": row.resume_ats_score if row.resume_ats_score is not None else 0,
+                    "pdf_url": row.resume_pdf_url,
                 }
             }
-        })
-    
-    return results
+        }
+        for row in rows
+    ]
 
 
 @app.patch("/applications/{application_id}")
@@ -2331,8 +3029,23 @@ def search_resumes(
     )
     
     if filters.skills:
-        for skill in filters.skills:
-            query = query.filter(models.Resume.skills.contains([skill]))
+        if is_postgres:
+            # One GIN-indexable @> containment covering all requested
+            # skills instead of N JSON predicates
+            query = query.filter(
+                cast(models.Resume.skills, JSONB).contains(filters.skills)
+            )
+        else:
+            # SQLite can't index JSON; the normalized resume_skills rows
+            # give each skill an indexed equality lookup instead
+            for skill in filters.skills:
+                query = query.filter(
+                    models.Resume.id.in_(
+                        db.query(models.ResumeSkill.resume_id).filter(
+                            models.ResumeSkill.skill == skill.lower().strip()
+                        )
+                    )
+                )
     
     if filters.location:
         query = query.filter(
@@ -2347,11 +3060,22 @@ def search_resumes(
     if filters.min_ats_score:
         query = query.filter(models.Resume.ats_score >= filters.min_ats_score)
     
-    # Order by ATS score (highest first)
-    query = query.order_by(models.Resume.ats_score.desc())
-    
-    total = query.count()
-    resumes = query.offset((filters.page - 1) * filters.limit).limit(filters.limit).all()
+    # Order by ATS score (highest first); id breaks ties so keyset
+    # pagination is stable
+    query = query.order_by(models.Resume.ats_score.desc(), models.Resume.id.desc())
+
+    if filters.cursor_score is not None and filters.cursor_id is not None:
+        # Keyset pagination: seek past the cursor row instead of
+        # OFFSET-scanning discarded pages; no COUNT(*) on this path
+        query = query.filter(
+            tuple_(models.Resume.ats_score, models.Resume.id)
+            < (filters.cursor_score, filters.cursor_id)
+        )
+        total = None
+        resumes = query.limit(filters.limit).all()
+    else:
+        total = query.count()
+        resumes = query.offset((filters.page - 1) * filters.limit).limit(filters.limit).all()
     
     results = []
     for resume in resumes:
@@ -2377,10 +3101,108 @@ def search_resumes(
         "resumes": results,
         "total": total,
         "page": filters.page,
-        "pages": (total + filters.limit - 1) // filters.limit
+        "pages": (total + filters.limit - 1) // filters.limit if total is not None else None,
+        # Feed back as cursor_score/cursor_id for O(limit) deep paging
+        "next_cursor": (
+            {"ats_score": resumes[-1].ats_score, "id": resumes[-1].id}
+            if len(resumes) == filters.limit
+            else None
+        ),
     }
 
 
+# Match scores are pure functions of (resume_data, job_data); cache them
+# by content hash so unchanged pairs skip the Python scoring loop.
+# Content-addressed keys need no invalidation - edits change the hash.
+MATCH_CACHE_MAX = 50_000
+
+_match_cache = {}  # (resume_key, job_key) -> MatchResult
+_match_cache_lock = threading.Lock()
+
+
+def _content_key(data) -> str:
+    return hashlib.blake2b(
+        orjson.dumps(data, option=orjson.OPT_SORT_KEYS, default=str),
+        digest_size=16,
+    ).hexdigest()
+
+
+def _cached_calculate_match(resume_data, job_data, job_key=None):
+    if job_key is None:
+        job_key = _content_key(job_data)
+    cache_key = (_content_key(resume_data), job_key)
+
+    with _match_cache_lock:
+        result = _match_cache.get(cache_key)
+    if result is not None:
+        return result
+
+    result = matcher.calculate_match(resume_data, job_data)
+    with _match_cache_lock:
+        if len(_match_cache) >= MATCH_CACHE_MAX:
+            _match_cache.clear()
+        _match_cache[cache_key] = result
+    return result
+
+
+def _cached_score_jobs(resume_data, job_datas):
+    """One resume against many jobs, cache-aware; misses go through the
+    (possibly parallel) scorer in one call."""
+    resume_key = _content_key(resume_data)
+    results = [None] * len(job_datas)
+    miss_entries = []  # (index, cache_key)
+
+    with _match_cache_lock:
+        for i, job_data in enumerate(job_datas):
+            cache_key = (resume_key, _content_key(job_data))
+            cached = _match_cache.get(cache_key)
+            if cached is None:
+                miss_entries.append((i, cache_key))
+            else:
+                results[i] = cached
+
+    if miss_entries:
+        scored = score_jobs_parallel(
+            resume_data, [job_datas[i] for i, _key in miss_entries]
+        )
+        with _match_cache_lock:
+            if len(_match_cache) >= MATCH_CACHE_MAX:
+                _match_cache.clear()
+            for (i, cache_key), result in zip(miss_entries, scored):
+                results[i] = result
+                _match_cache[cache_key] = result
+    return results
+
+
+def _cached_calculate_match_batch(resume_datas, job_data):
+    """Batch variant: cache hits are looked up, misses go through the
+    vectorized matcher in one call."""
+    job_key = _content_key(job_data)
+    results = [None] * len(resume_datas)
+    miss_entries = []  # (index, cache_key)
+
+    with _match_cache_lock:
+        for i, resume_data in enumerate(resume_datas):
+            cache_key = (_content_key(resume_data), job_key)
+            cached = _match_cache.get(cache_key)
+            if cached is None:
+                miss_entries.append((i, cache_key))
+            else:
+                results[i] = cached
+
+    if miss_entries:
+        scored = matcher.calculate_match_batch(
+            [resume_datas[i] for i, _key in miss_entries], job_data
+        )
+        with _match_cache_lock:
+            if len(_match_cache) >= MATCH_CACHE_MAX:
+                _match_cache.clear()
+            for (i, cache_key), result in zip(miss_entries, scored):
+                results[i] = result
+                _match_cache[cache_key] = result
+    return results
+
+
 @app.post("/jobs/{job_id}/match-candidates")
 def match_candidates_to_job(
     job_id: int,
@@ -2398,11 +3220,27 @@ def match_candidates_to_job(
     if job.posted_by_id != current_user.id:
         raise HTTPException(status_code=403, detail="Not authorized")
     
-    # Get all public resumes
-    resumes = db.query(models.Resume).filter(
+    # Get public resumes, prefiltered in SQL to those sharing at least one
+    # required skill - no point hydrating and scoring candidates with zero
+    # overlap. Capped so pathological jobs can't pull the whole table.
+    resumes_query = db.query(models.Resume).filter(
         models.Resume.is_public == 1,
         models.Resume.is_active == 1
-    ).all()
+    )
+    if job.required_skills:
+        # Expand each required skill to its known alias spellings, then
+        # match the quoted element anywhere in the serialized JSON array
+        # (JSON .contains compiles to LIKE over the whole serialized list,
+        # which only ever matches single-element arrays); ILIKE keeps the
+        # prefilter case-insensitive like the fuzzy scorer
+        predicates = []
+        for skill in job.required_skills:
+            for form in skill_match_forms(skill):
+                predicates.append(
+                    cast(models.Resume.skills, String).ilike(f'%"{form}"%')
+                )
+        resumes_query = resumes_query.filter(or_(*predicates))
+    resumes = resumes_query.limit(500).all()
     
     job_data = {
         'title': job.title,
@@ -2416,19 +3254,21 @@ def match_candidates_to_job(
         'keywords': job.keywords,
     }
     
-    # Rank candidates
-    ranked = []
-    for resume in resumes:
-        resume_data = {
+    # Rank candidates with the vectorized batch scorer (cache-aware)
+    resume_datas = [
+        {
             'skills': resume.skills,
             'work_experience': resume.work_experience,
             'preferred_location': resume.preferred_location,
             'remote_preference': resume.remote_preference,
             'keywords': resume.keywords,
         }
-        
-        match_result = matcher.calculate_match(resume_data, job_data)
-        
+        for resume in resumes
+    ]
+    match_results = _cached_calculate_match_batch(resume_datas, job_data)
+
+    ranked = []
+    for resume, match_result in zip(resumes, match_results):
         if match_result.score >= min_score:
             ranked.append({
                 "resume": {
@@ -2450,246 +3290,116 @@ def match_candidates_to_job(
                 "match_reasons": match_result.reasons,
             })
     
-    # Sort by match score
-    ranked.sort(key=lambda x: x["match_score"], reverse=True)
-    
+    # Top-50 selection without sorting the whole candidate list
+    top_candidates = heapq.nlargest(50, ranked, key=lambda x: x["match_score"])
+
     return {
         "job_id": job_id,
         "total_matches": len(ranked),
-        "candidates": ranked[:50]  # Return top 50 matches
+        "candidates": top_candidates
     }
 
 
 # --------------------------------------------------
-# Job Recommendations (For Candidates)
+# Job Categories & Metadata
 # --------------------------------------------------
 
-@app.get("/jobs/recommended")
-def get_recommended_jobs(
-    limit: int = 10,
-    current_user: models.User = Depends(authenticate),
-    db: Session = Depends(get_db),
-):
-    """Get job recommendations based on resume."""
-    try:
-        resume = db.query(models.Resume).filter(models.Resume.user_id == current_user.id).first()
-        
-        if not resume:
-            # Return recent jobs if no resume
-            jobs = db.query(models.Job).filter(
-                models.Job.status == "active"
-            ).order_by(models.Job.created_at.desc()).limit(limit).all()
-            
-            # Format jobs for response
-            results = []
-            for job in jobs:
-                results.append({
-                    "id": job.id,
-                    "title": job.title,
-                    "company": {
-                        "id": job.company.id if job.company else None,
-                        "name": job.company.name if job.company else "Unknown Company",
-                        "logo_url": job.company.logo_url if job.company else None,
-                    } if job.company else {"name": "Unknown Company"},
-                    "location": job.location,
-                    "is_remote": bool(job.is_remote),
-                    "employment_type": job.employment_type,
-                    "salary_min": job.salary_min,
-                    "salary_max": job.salary_max,
-                    "required_skills": job.required_skills,
-                    "match_score": None,
-                    "matching_skills": [],
-                    "match_reasons": [],
-                })
-            
-            return {"jobs": results, "source": "recent"}
-        
-        # Parse work_experience if it's stored as strings
-        import ast
-        work_exp = resume.work_experience or []
-        parsed_work_exp = []
-        for exp in work_exp:
-            if isinstance(exp, str) and exp.startswith('{') and exp.endswith('}'):
-                try:
-                    parsed_exp = ast.literal_eval(exp)
-                    if isinstance(parsed_exp, dict):
-                        parsed_work_exp.append(parsed_exp)
-                    else:
-                        parsed_work_exp.append(exp)
-                except (ValueError, SyntaxError):
-                    parsed_work_exp.append(exp)
-            else:
-                parsed_work_exp.append(exp)
-        
-        resume_data = {
-            'skills': resume.skills or [],
-            'work_experience': parsed_work_exp,
-            'preferred_location': resume.preferred_location or '',
-            'remote_preference': resume.remote_preference or 'any',
-            'keywords': resume.keywords or [],
-        }
-        
-        # Get active jobs
-        jobs = db.query(models.Job).filter(
-            models.Job.status == "active"
-        ).all()
-        
-        # Score and rank
-        scored_jobs = []
-        for job in jobs:
-            try:
-                job_data = {
-                    'title': job.title or '',
-                    'description': job.description or '',
-                    'required_skills': job.required_skills or [],
-                    'nice_to_have_skills': job.nice_to_have_skills or [],
-                    'experience_level': job.experience_level or '',
-                    'location': job.location or '',
-                    'is_remote': bool(job.is_remote),
-                    'is_hybrid': bool(job.is_hybrid),
-                    'keywords': job.keywords or [],
-                }
-                
-                match_result = matcher.calculate_match(resume_data, job_data)
-                
-                scored_jobs.append({
-                    "job": job,
-                    "match_score": match_result.score,
-                    "matching_skills": match_result.matching_skills,
-                    "match_reasons": match_result.reasons,
-                })
-            except Exception as e:
-                log.error(f"Error matching job {job.id}: {e}")
-                # Still add job with 0 score
-                scored_jobs.append({
-                    "job": job,
-                    "match_score": 0,
-                    "matching_skills": [],
-                    "match_reasons": [],
-                })
-        
-        # Sort by match score
-        scored_jobs.sort(key=lambda x: x["match_score"], reverse=True)
-        
-        # Format response
-        results = []
-        for item in scored_jobs[:limit]:
-            try:
-                job = item["job"]
-                results.append({
-                    "id": job.id,
-                    "title": job.title,
-                    "company": {
-                        "id": job.company.id if job.company else None,
-                        "name": job.company.name if job.company else "Unknown Company",
-                        "logo_url": job.company.logo_url if job.company else None,
-                    } if job.company else {"name": "Unknown Company"},
-                    "location": job.location,
-                    "is_remote": bool(job.is_remote),
-                    "employment_type": job.employment_type,
-                    "salary_min": job.salary_min,
-                    "salary_max": job.salary_max,
-                    "required_skills": job.required_skills,
-                    "match_score": round(item["match_score"]),
-                    "matching_skills": item["matching_skills"],
-                    "match_reasons": item["match_reasons"],
-                })
-            except Exception as e:
-                log.error(f"Error formatting job result: {e}")
-                continue
-        
-        return {"jobs": results, "source": "matched"}
-    except Exception as e:
-        log.error(f"Error in get_recommended_jobs: {e}")
-        raise HTTPException(status_code=500, detail=f"Failed to get recommendations: {str(e)}")
-
+# Static metadata payloads serialized once at import; the handlers just
+# hand the bytes back, skipping per-request encoding entirely
+_JOB_CATEGORIES_JSON = orjson.dumps([
+    "Software Engineering",
+    "Data Science",
+    "Product Management",
+    "Design",
+    "Marketing",
+    "Sales",
+    "Customer Support",
+    "Human Resources",
+    "Finance",
+    "Operations",
+    "Legal",
+    "Healthcare",
+    "Education",
+    "Other"
+])
+
+_EMPLOYMENT_TYPES_JSON = orjson.dumps([
+    {"value": "full-time", "label": "Full-time"},
+    {"value": "part-time", "label": "Part-time"},
+    {"value": "contract", "label": "Contract"},
+    {"value": "internship", "label": "Internship"},
+    {"value": "freelance", "label": "Freelance"},
+])
+
+_EXPERIENCE_LEVELS_JSON = orjson.dumps([
+    {"value": "entry", "label": "Entry Level"},
+    {"value": "mid", "label": "Mid Level"},
+    {"value": "senior", "label": "Senior Level"},
+    {"value": "lead", "label": "Lead"},
+    {"value": "executive", "label": "Executive"},
+])
+
+_COMPANY_SIZES_JSON = orjson.dumps([
+    {"value": "1-10", "label": "1-10 employees"},
+    {"value": "11-50", "label": "11-50 employees"},
+    {"value": "51-200", "label": "51-200 employees"},
+    {"value": "201-500", "label": "201-500 employees"},
+    {"value": "501-1000", "label": "501-1000 employees"},
+    {"value": "1000+", "label": "1000+ employees"},
+])
 
-# --------------------------------------------------
-# Job Categories & Metadata
-# --------------------------------------------------
 
 @app.get("/jobs/metadata/categories")
 def get_job_categories():
     """Get all job categories."""
-    categories = [
-        "Software Engineering",
-        "Data Science",
-        "Product Management",
-        "Design",
-        "Marketing",
-        "Sales",
-        "Customer Support",
-        "Human Resources",
-        "Finance",
-        "Operations",
-        "Legal",
-        "Healthcare",
-        "Education",
-        "Other"
-    ]
-    return categories
+    return Response(content=_JOB_CATEGORIES_JSON, media_type="application/json")
 
 
 @app.get("/jobs/metadata/employment-types")
 def get_employment_types():
     """Get all employment types."""
-    return [
-        {"value": "full-time", "label": "Full-time"},
-        {"value": "part-time", "label": "Part-time"},
-        {"value": "contract", "label": "Contract"},
-        {"value": "internship", "label": "Internship"},
-        {"value": "freelance", "label": "Freelance"},
-    ]
+    return Response(content=_EMPLOYMENT_TYPES_JSON, media_type="application/json")
 
 
 @app.get("/jobs/metadata/experience-levels")
 def get_experience_levels():
     """Get all experience levels."""
-    return [
-        {"value": "entry", "label": "Entry Level"},
-        {"value": "mid", "label": "Mid Level"},
-        {"value": "senior", "label": "Senior Level"},
-        {"value": "lead", "label": "Lead"},
-        {"value": "executive", "label": "Executive"},
-    ]
+    return Response(content=_EXPERIENCE_LEVELS_JSON, media_type="application/json")
 
 
 @app.get("/jobs/metadata/company-sizes")
 def get_company_sizes():
     """Get all company size options."""
-    return [
-        {"value": "1-10", "label": "1-10 employees"},
-        {"value": "11-50", "label": "11-50 employees"},
-        {"value": "51-200", "label": "51-200 employees"},
-        {"value": "201-500", "label": "201-500 employees"},
-        {"value": "501-1000", "label": "501-1000 employees"},
-        {"value": "1000+", "label": "1000+ employees"},
-    ]
+    return Response(content=_COMPANY_SIZES_JSON, media_type="application/json")
 
 
 # ============================================================
 # MONETIZATION & BILLING API
 # ============================================================
 
+# Built from module constants; serialized once at import
+_SUBSCRIPTION_PLANS_JSON = orjson.dumps({
+    "plans": [
+        {
+            "id": plan_id,
+            "name": plan["display_name"],
+            "description": plan["description"],
+            "price_monthly": plan["price_monthly"],
+            "price_yearly": plan["price_yearly"],
+            "features": plan["features"],
+            "limits": plan["limits"],
+        }
+        for plan_id, plan in SUBSCRIPTION_PLANS.items()
+    ],
+    "credit_packs": CREDIT_PACKS,
+    "job_packages": JOB_POSTING_PACKAGES,
+})
+
+
 @app.get("/billing/plans")
 def get_subscription_plans():
     """Get all available subscription plans"""
-    return {
-        "plans": [
-            {
-                "id": plan_id,
-                "name": plan["display_name"],
-                "description": plan["description"],
-                "price_monthly": plan["price_monthly"],
-                "price_yearly": plan["price_yearly"],
-                "features": plan["features"],
-                "limits": plan["limits"],
-            }
-            for plan_id, plan in SUBSCRIPTION_PLANS.items()
-        ],
-        "credit_packs": CREDIT_PACKS,
-        "job_packages": JOB_POSTING_PACKAGES,
-    }
+    return Response(content=_SUBSCRIPTION_PLANS_JSON, media_type="application/json")
 
 
 @app.get("/billing/current")
@@ -2803,9 +3513,11 @@ async def stripe_webhook(request: Request):
     """Handle Stripe webhook events"""
     payload = await request.body()
     sig_header = request.headers.get("stripe-signature", "")
-    
+
     try:
-        result = billing_manager.handle_webhook(payload, sig_header)
+        # Signature verification and any Stripe API calls are blocking;
+        # keep them off the event loop
+        result = await asyncio.to_thread(billing_manager.handle_webhook, payload, sig_header)
         return result
     except Exception as e:
         log.error(f"Webhook error: {e}")
@@ -2821,34 +3533,55 @@ def get_usage_stats(
     """Get user's usage statistics"""
     from_date = datetime.utcnow() - timedelta(days=days)
     
-    usage_records = db.query(models.UsageRecord).filter(
-        models.UsageRecord.user_id == current_user.id,
-        models.UsageRecord.created_at >= from_date
-    ).all()
-    
-    # Aggregate by type
-    usage_by_type = {}
-    total_credits = 0
-    
-    for record in usage_records:
-        if record.usage_type not in usage_by_type:
-            usage_by_type[record.usage_type] = {"count": 0, "credits": 0}
-        usage_by_type[record.usage_type]["count"] += record.quantity
-        usage_by_type[record.usage_type]["credits"] += record.credits_used
-        total_credits += record.credits_used
-    
+    # Aggregate in SQL instead of hydrating every record into Python
+    aggregates = (
+        db.query(
+            models.UsageRecord.usage_type,
+            func.sum(models.UsageRecord.quantity).label("count"),
+            func.sum(models.UsageRecord.credits_used).label("credits"),
+        )
+        .filter(
+            models.UsageRecord.user_id == current_user.id,
+            models.UsageRecord.created_at >= from_date,
+        )
+        .group_by(models.UsageRecord.usage_type)
+        .all()
+    )
+
+    usage_by_type = {
+        row.usage_type: {"count": row.count or 0, "credits": row.credits or 0}
+        for row in aggregates
+    }
+    total_credits = sum(entry["credits"] for entry in usage_by_type.values())
+
+    recent_records = (
+        db.query(
+            models.UsageRecord.usage_type,
+            models.UsageRecord.quantity,
+            models.UsageRecord.credits_used,
+            models.UsageRecord.created_at,
+        )
+        .filter(
+            models.UsageRecord.user_id == current_user.id,
+            models.UsageRecord.created_at >= from_date,
+        )
+        .order_by(models.UsageRecord.created_at.desc())
+        .limit(10)
+        .all()
+    )
+
     return {
         "period_days": days,
         "total_credits_used": total_credits,
         "usage_by_type": usage_by_type,
         "recent_records": [
             {
-                "type": r.usage_type,
-                "quantity": r.quantity,
-                "credits": r.credits_used,
-                "date": r.created_at,
+                "type": row.usage_type,
+                "quantity": row.quantity,
+                "credits": row.credits_used,
+                "date": row.created_at,
             }
-            for r in usage_records[:10]
+            for row in recent_records
         ],
     }
 
@@ -5,7 +5,86 @@ Provides semantic matching between job postings and candidate resumes.
 
 from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass
+from functools import lru_cache, partial
+import heapq
+import multiprocessing
+import os
 import re
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+# Common skill variations, flattened once at import into an
+# alias -> canonical map so the match hot path is two dict lookups
+_SKILL_VARIATIONS = {
+    'javascript': ['js', 'ecmascript'],
+    'typescript': ['ts'],
+    'python': ['py'],
+    'react': ['reactjs', 'react.js'],
+    'node': ['nodejs', 'node.js'],
+    'aws': ['amazon web services'],
+    'gcp': ['google cloud platform', 'google cloud'],
+    'azure': ['microsoft azure'],
+    'machine learning': ['ml'],
+    'artificial intelligence': ['ai'],
+    'user interface': ['ui'],
+    'user experience': ['ux'],
+}
+
+_SKILL_CANON = {
+    alias: canonical
+    for canonical, aliases in _SKILL_VARIATIONS.items()
+    for alias in [canonical, *aliases]
+}
+
+
+# Compiled once; used for keyword extraction from job descriptions
+_KEYWORD_RE = re.compile(r'\b[A-Za-z]{4,}\b')
+
+
+@lru_cache(maxsize=2048)
+def _description_keywords(job_description: str) -> frozenset:
+    """Keyword set of a job description, cached per description text.
+
+    Ranking loops score many resumes against the same jobs, so the
+    regex scan over each description runs once instead of per pair.
+    """
+    return frozenset(_KEYWORD_RE.findall(job_description.lower()))
+
+
+# Canonicalized skill tokens interned to integer ids: exact/alias skill
+# matches become one set intersection instead of nested string loops
+_SKILL_INTERN: Dict[str, int] = {}
+_skill_intern_lock = threading.Lock()
+
+
+def _intern_skill(skill_lower: str) -> int:
+    token = _SKILL_CANON.get(skill_lower, skill_lower)
+    skill_id = _SKILL_INTERN.get(token)
+    if skill_id is None:
+        with _skill_intern_lock:
+            skill_id = _SKILL_INTERN.setdefault(token, len(_SKILL_INTERN))
+    return skill_id
+
+
+def _skills_to_bits(skill_ids) -> int:
+    """Pack interned skill ids into one int bitset (id == bit position)."""
+    bits = 0
+    for skill_id in skill_ids:
+        bits |= 1 << skill_id
+    return bits
+
+
+def skill_match_forms(skill: str) -> List[str]:
+    """Known equivalent spellings of a skill (for SQL prefilters)."""
+    base = skill.lower().strip()
+    forms = {base}
+    canonical = _SKILL_CANON.get(base)
+    if canonical is not None:
+        forms.add(canonical)
+        forms.update(_SKILL_VARIATIONS[canonical])
+    return sorted(forms)
 
 
 @dataclass
@@ -18,6 +97,22 @@ class MatchResult:
     reasons: List[str]
 
 
+@dataclass
+class ResumeFeatures:
+    """Resume-side values that are independent of the job being scored.
+
+    Built once per resume and reused across every job in a ranking loop,
+    so the lowercasing/parsing work doesn't repeat per job.
+    """
+    resume: Dict[str, Any]
+    skills_lower: List[str]
+    skill_ids: frozenset
+    skill_bits: int
+    keywords_lower: frozenset
+    titles_lower: List[str]
+    total_years: float
+
+
 class JobResumeMatcher:
     """Match resumes to job postings based on multiple criteria."""
     
@@ -27,37 +122,80 @@ class JobResumeMatcher:
             'nice_to_have': 1.0
         }
     
+    def build_resume_features(self, resume: Dict[str, Any]) -> ResumeFeatures:
+        """Precompute the resume-side normalization once."""
+        work_experience = resume.get('work_experience', []) or []
+        skills_lower = [s.lower() for s in resume.get('skills', []) or []]
+        skill_ids = frozenset(_intern_skill(s) for s in skills_lower)
+        return ResumeFeatures(
+            resume=resume,
+            skills_lower=skills_lower,
+            skill_ids=skill_ids,
+            skill_bits=_skills_to_bits(skill_ids),
+            keywords_lower=frozenset(
+                k.lower() for k in resume.get('keywords', []) or []
+            ),
+            titles_lower=[
+                exp.get('title', '').lower()
+                for exp in work_experience
+                if isinstance(exp, dict) and exp.get('title')
+            ],
+            total_years=self._calculate_total_years_experience(work_experience),
+        )
+
     def calculate_match(
         self,
         resume: Dict[str, Any],
-        job: Dict[str, Any]
+        job: Dict[str, Any],
+        _skills_precomputed: Optional[Tuple[float, List[str], List[str]]] = None,
     ) -> MatchResult:
         """Calculate comprehensive match score between a resume and job."""
-        
+        return self.calculate_match_pre(
+            self.build_resume_features(resume), job,
+            _skills_precomputed=_skills_precomputed,
+        )
+
+    def calculate_match_pre(
+        self,
+        features: ResumeFeatures,
+        job: Dict[str, Any],
+        _skills_precomputed: Optional[Tuple[float, List[str], List[str]]] = None,
+    ) -> MatchResult:
+        """calculate_match against precomputed resume features.
+
+        Ranking loops build the features once and call this per job, so
+        none of the resume-side lowercasing repeats.
+        """
+        resume = features.resume
         matching_skills = []
         missing_skills = []
         reasons = []
-        
+
         # 1. Skills Match (40% of total score)
-        skills_score, matched, missing = self._calculate_skills_match(
-            resume.get('skills', []),
-            job.get('required_skills', []),
-            job.get('nice_to_have_skills', [])
-        )
+        if _skills_precomputed is not None:
+            # Batch path already vectorized this component
+            skills_score, matched, missing = _skills_precomputed
+        else:
+            skills_score, matched, missing = self._calculate_skills_match(
+                features.skills_lower,
+                job.get('required_skills', []),
+                job.get('nice_to_have_skills', []),
+                resume_skill_bits=features.skill_bits,
+            )
         matching_skills = matched
         missing_skills = missing
-        
+
         if matched:
             reasons.append(f"Matches {len(matched)} required/nice-to-have skills")
-        
+
         # 2. Experience Level Match (20% of total score)
         experience_score = self._calculate_experience_match(
-            resume.get('work_experience', []),
+            features.total_years,
             job.get('experience_level', '')
         )
         if experience_score >= 80:
             reasons.append("Experience level matches job requirements")
-        
+
         # 3. Location Match (15% of total score)
         location_score = self._calculate_location_match(
             resume.get('preferred_location', ''),
@@ -68,19 +206,19 @@ class JobResumeMatcher:
         )
         if location_score >= 80:
             reasons.append("Location preferences align")
-        
+
         # 4. Keyword/Semantic Match (15% of total score)
         keyword_score = self._calculate_keyword_match(
-            resume.get('keywords', []),
+            features.keywords_lower,
             job.get('keywords', []),
             job.get('description', '')
         )
         if keyword_score >= 70:
             reasons.append("Strong keyword alignment with job description")
-        
+
         # 5. Title Match (10% of total score)
         title_score = self._calculate_title_match(
-            resume.get('work_experience', []),
+            features.titles_lower,
             job.get('title', '')
         )
         if title_score >= 70:
@@ -111,90 +249,83 @@ class JobResumeMatcher:
     
     def _calculate_skills_match(
         self,
-        resume_skills: List[str],
+        resume_skills_lower: List[str],
         required_skills: List[str],
-        nice_to_have_skills: List[str]
+        nice_to_have_skills: List[str],
+        resume_skill_bits: Optional[int] = None,
     ) -> Tuple[float, List[str], List[str]]:
-        """Calculate skills match score."""
+        """Calculate skills match score (resume skills pre-lowercased).
+
+        Exact and alias matches resolve against the resume's skill
+        bitset with a single shift-and-mask; the per-skill fuzzy scan
+        only runs for skills the bitset misses (substrings).
+        """
         if not required_skills and not nice_to_have_skills:
             return 100, [], []
-        
-        resume_skills_lower = [s.lower() for s in resume_skills]
-        
+
+        if resume_skill_bits is None:
+            resume_skill_bits = _skills_to_bits(
+                _intern_skill(skill) for skill in resume_skills_lower
+            )
+
         matched = []
         missing = []
         score = 0
         max_score = 0
-        
+
         # Check required skills (weighted more heavily)
         for skill in required_skills:
+            skill_lower = skill.lower()
             max_score += self.skill_weights['required']
-            if any(self._skill_matches(skill.lower(), rs) for rs in resume_skills_lower):
+            if (resume_skill_bits >> _intern_skill(skill_lower)) & 1 or any(
+                self._skill_matches(skill_lower, rs) for rs in resume_skills_lower
+            ):
                 score += self.skill_weights['required']
                 matched.append(skill)
             else:
                 missing.append(skill)
-        
+
         # Check nice-to-have skills
         for skill in nice_to_have_skills:
+            skill_lower = skill.lower()
             max_score += self.skill_weights['nice_to_have']
-            if any(self._skill_matches(skill.lower(), rs) for rs in resume_skills_lower):
+            if (resume_skill_bits >> _intern_skill(skill_lower)) & 1 or any(
+                self._skill_matches(skill_lower, rs) for rs in resume_skills_lower
+            ):
                 score += self.skill_weights['nice_to_have']
                 matched.append(skill)
-        
+
         if max_score == 0:
             return 100, matched, missing
-        
+
         return (score / max_score) * 100, matched, missing
     
     def _skill_matches(self, job_skill: str, resume_skill: str) -> bool:
         """Check if a resume skill matches a job skill (with fuzzy matching)."""
         job_skill = job_skill.lower().strip()
         resume_skill = resume_skill.lower().strip()
-        
+
         # Exact match
         if job_skill == resume_skill:
             return True
-        
+
         # Contains match
         if job_skill in resume_skill or resume_skill in job_skill:
             return True
-        
-        # Common variations
-        variations = {
-            'javascript': ['js', 'ecmascript'],
-            'typescript': ['ts'],
-            'python': ['py'],
-            'react': ['reactjs', 'react.js'],
-            'node': ['nodejs', 'node.js'],
-            'aws': ['amazon web services'],
-            'gcp': ['google cloud platform', 'google cloud'],
-            'azure': ['microsoft azure'],
-            'machine learning': ['ml'],
-            'artificial intelligence': ['ai'],
-            'user interface': ['ui'],
-            'user experience': ['ux'],
-        }
-        
-        for main, alts in variations.items():
-            all_forms = [main] + alts
-            if job_skill in all_forms and resume_skill in all_forms:
-                return True
-        
-        return False
+
+        # Common variations: two O(1) canonical lookups
+        canonical = _SKILL_CANON.get(job_skill)
+        return canonical is not None and canonical == _SKILL_CANON.get(resume_skill)
     
     def _calculate_experience_match(
         self,
-        work_experience: List[Dict[str, Any]],
+        total_years: float,
         required_level: str
     ) -> float:
-        """Calculate experience level match."""
+        """Calculate experience level match from precomputed total years."""
         if not required_level:
             return 100
-        
-        # Calculate total years of experience
-        total_years = self._calculate_total_years_experience(work_experience)
-        
+
         # Define expected years for each level
         level_expectations = {
             'entry': (0, 2),
@@ -295,23 +426,17 @@ class JobResumeMatcher:
     
     def _calculate_keyword_match(
         self,
-        resume_keywords: List[str],
+        resume_kw_set: frozenset,
         job_keywords: List[str],
         job_description: str
     ) -> float:
-        """Calculate keyword/semantic match."""
+        """Calculate keyword/semantic match (resume keywords pre-lowercased)."""
         if not job_keywords and not job_description:
             return 100
-        
-        resume_kw_set = set(k.lower() for k in resume_keywords)
-        
-        # Extract keywords from job description
-        desc_keywords = set()
-        if job_description:
-            # Simple keyword extraction (in production, use NLP)
-            words = re.findall(r'\b[A-Za-z]{4,}\b', job_description.lower())
-            desc_keywords = set(words)
-        
+
+        # Extract keywords from job description (cached per description)
+        desc_keywords = _description_keywords(job_description) if job_description else frozenset()
+
         all_job_keywords = set(k.lower() for k in job_keywords) | desc_keywords
         
         if not all_job_keywords:
@@ -323,21 +448,18 @@ class JobResumeMatcher:
     
     def _calculate_title_match(
         self,
-        work_experience: List[Dict[str, Any]],
+        titles_lower: List[str],
         job_title: str
     ) -> float:
-        """Calculate job title similarity."""
-        if not job_title or not work_experience:
+        """Calculate job title similarity (previous titles pre-lowercased)."""
+        if not job_title or not titles_lower:
             return 50  # Neutral
-        
+
         job_title_lower = job_title.lower()
         best_match = 0
-        
-        for job in work_experience:
-            exp_title = job.get('title', '').lower()
-            if not exp_title:
-                continue
-            
+
+        for exp_title in titles_lower:
+
             # Exact match
             if job_title_lower == exp_title:
                 return 100
@@ -355,42 +477,129 @@ class JobResumeMatcher:
         
         return best_match
     
+    def calculate_match_batch(
+        self,
+        resumes: List[Dict[str, Any]],
+        job: Dict[str, Any]
+    ) -> List[MatchResult]:
+        """Score many resumes against one job.
+
+        The fuzzy skill comparison dominates the per-resume cost, so it is
+        hoisted out of the loop: every unique resume skill in the batch is
+        compared against the job's skills once, producing a boolean
+        (job_skill x vocab) matrix, and per-resume skill scores reduce from
+        NumPy slices of that matrix instead of nested Python loops. The
+        remaining components reuse calculate_match so scores are identical
+        to the one-at-a-time path.
+        """
+        required = job.get('required_skills', []) or []
+        nice_to_have = job.get('nice_to_have_skills', []) or []
+        job_skills = [(s, self.skill_weights['required']) for s in required]
+        job_skills += [(s, self.skill_weights['nice_to_have']) for s in nice_to_have]
+
+        if not job_skills or not resumes:
+            return [self.calculate_match(resume, job) for resume in resumes]
+
+        # Intern every unique (lowercased) resume skill in the batch
+        vocab: Dict[str, int] = {}
+        resume_indices = []
+        for resume in resumes:
+            indices = set()
+            for skill in resume.get('skills', []) or []:
+                key = skill.lower()
+                if key not in vocab:
+                    vocab[key] = len(vocab)
+                indices.add(vocab[key])
+            resume_indices.append(np.fromiter(sorted(indices), dtype=np.intp, count=len(indices)))
+
+        # match_matrix[j, v]: does job skill j fuzzy-match vocab skill v
+        vocab_skills = list(vocab)
+        match_matrix = np.zeros((len(job_skills), len(vocab)), dtype=bool)
+        for j, (skill, _weight) in enumerate(job_skills):
+            skill_lower = skill.lower()
+            for v, resume_skill in enumerate(vocab_skills):
+                if self._skill_matches(skill_lower, resume_skill):
+                    match_matrix[j, v] = True
+
+        weights = np.array([weight for _skill, weight in job_skills])
+        max_score = weights.sum()
+        required_count = len(required)
+
+        results = []
+        for resume, indices in zip(resumes, resume_indices):
+            if indices.size:
+                matched_mask = match_matrix[:, indices].any(axis=1)
+            else:
+                matched_mask = np.zeros(len(job_skills), dtype=bool)
+
+            score = float(weights[matched_mask].sum())
+            matched = [job_skills[j][0] for j in np.flatnonzero(matched_mask)]
+            missing = [
+                required[j]
+                for j in range(required_count)
+                if not matched_mask[j]
+            ]
+            skills_score = (score / max_score) * 100 if max_score else 100
+
+            results.append(self.calculate_match(
+                resume, job,
+                _skills_precomputed=(skills_score, matched, missing),
+            ))
+        return results
+
     def rank_candidates(
         self,
         resumes: List[Dict[str, Any]],
         job: Dict[str, Any],
-        min_score: float = 0
+        min_score: float = 0,
+        top_k: Optional[int] = None
     ) -> List[Tuple[Dict[str, Any], MatchResult]]:
-        """Rank candidates by match score for a given job."""
+        """Rank candidates by match score for a given job.
+
+        Pass top_k to select the best K in O(N log K) instead of
+        sorting the full list.
+        """
         results = []
-        
+
         for resume in resumes:
             match = self.calculate_match(resume, job)
             if match.score >= min_score:
                 results.append((resume, match))
-        
+
+        if top_k is not None:
+            return heapq.nlargest(top_k, results, key=lambda x: x[1].score)
+
         # Sort by score descending
         results.sort(key=lambda x: x[1].score, reverse=True)
-        
+
         return results
-    
+
     def find_matching_jobs(
         self,
         resume: Dict[str, Any],
         jobs: List[Dict[str, Any]],
-        min_score: float = 0
+        min_score: float = 0,
+        top_k: Optional[int] = None
     ) -> List[Tuple[Dict[str, Any], MatchResult]]:
-        """Find jobs that match a candidate's resume."""
+        """Find jobs that match a candidate's resume.
+
+        Pass top_k to select the best K in O(N log K) instead of
+        sorting the full list.
+        """
+        features = self.build_resume_features(resume)
         results = []
-        
+
         for job in jobs:
-            match = self.calculate_match(resume, job)
+            match = self.calculate_match_pre(features, job)
             if match.score >= min_score:
                 results.append((job, match))
-        
+
+        if top_k is not None:
+            return heapq.nlargest(top_k, results, key=lambda x: x[1].score)
+
         # Sort by score descending
         results.sort(key=lambda x: x[1].score, reverse=True)
-        
+
         return results
 
 
@@ -399,3 +608,45 @@ from datetime import datetime
 
 # Singleton instance
 matcher = JobResumeMatcher()
+
+# Scoring is pure-Python and CPU-bound; for large job sets the ranking
+# loop fans out over a process pool (spawn context - workers only
+# re-import this module, and forking a threaded server isn't safe).
+# Small sets score in-process since pool dispatch costs more than the
+# loop itself.
+MATCH_POOL_MIN_JOBS = 128
+MATCH_POOL_CHUNK_SIZE = 64
+
+_match_pool = None
+
+
+def _get_match_pool():
+    global _match_pool
+    if _match_pool is None:
+        _match_pool = ProcessPoolExecutor(
+            max_workers=min(os.cpu_count() or 2, 4),
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _match_pool
+
+
+def _score_job_chunk(resume_data, jobs_chunk):
+    features = matcher.build_resume_features(resume_data)
+    return [matcher.calculate_match_pre(features, job) for job in jobs_chunk]
+
+
+def score_jobs_parallel(resume_data, job_datas, chunk_size=MATCH_POOL_CHUNK_SIZE):
+    """Score one resume against many jobs, fanning out for large sets."""
+    if len(job_datas) < MATCH_POOL_MIN_JOBS:
+        return _score_job_chunk(resume_data, job_datas)
+
+    chunks = [
+        job_datas[i:i + chunk_size]
+        for i in range(0, len(job_datas), chunk_size)
+    ]
+    results = []
+    for chunk_results in _get_match_pool().map(
+        partial(_score_job_chunk, resume_data), chunks
+    ):
+        results.extend(chunk_results)
+    return results
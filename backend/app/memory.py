@@ -1,10 +1,26 @@
-import redis, json, os
+import orjson
+import redis
 
-r = redis.Redis.from_url(os.getenv("REDIS_URL"))
+from app.redis_client import r
 
 def get_memory(session_id):
-    return [json.loads(x) for x in r.lrange(session_id, -10, -1)]
+    try:
+        entries = r.xrevrange(session_id, count=10)
+    except redis.ResponseError:
+        # Legacy LIST-based session from before the stream switch
+        return [orjson.loads(x) for x in r.lrange(session_id, -10, -1)]
+    return [
+        {"role": fields[b"role"].decode(), "content": fields[b"content"].decode()}
+        for _entry_id, fields in reversed(entries)
+    ]
 
 def add_memory(session_id, role, content):
-    r.rpush(session_id, json.dumps({"role": role, "content": content}))
-    r.ltrim(session_id, -10, -1)
+    # XADD with MAXLEN ~ caps the stream in one atomic command; no
+    # separate trim and no O(deleted) list-head rewrite per append
+    entry = {"role": role, "content": content}
+    try:
+        r.xadd(session_id, entry, maxlen=10, approximate=True)
+    except redis.ResponseError:
+        # Key still holds a legacy LIST; replace it with a stream
+        r.delete(session_id)
+        r.xadd(session_id, entry, maxlen=10, approximate=True)
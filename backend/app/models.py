@@ -1,8 +1,9 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Text, Float, Boolean, JSON, UniqueConstraint
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Text, Float, Boolean, JSON, UniqueConstraint, Index, insert, Computed
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import relationship
 from datetime import datetime
 import uuid
-from app.database import Base
+from app.database import Base, is_postgres
 
 class User(Base):
     __tablename__ = "users"
@@ -54,20 +55,30 @@ class CustomModel(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
 
     owner = relationship("User", back_populates="custom_models")
-    files = relationship("ModelFile", back_populates="model", cascade="all, delete-orphan")
+    # DB-level cascade: deleting a model is one DELETE, children go with
+    # it server-side instead of being loaded and deleted row by row
+    files = relationship(
+        "ModelFile", back_populates="model",
+        cascade="all, delete-orphan", passive_deletes=True,
+    )
 
 class ModelFile(Base):
     __tablename__ = "model_files"
 
     id = Column(Integer, primary_key=True, index=True)
-    model_id = Column(Integer, ForeignKey("custom_models.id"))
+    model_id = Column(Integer, ForeignKey("custom_models.id", ondelete="CASCADE"))
     filename = Column(String)
     file_path = Column(String)
+    file_type = Column(String)
     extracted_text = Column(Text)  # Extracted content for RAG
     created_at = Column(DateTime, default=datetime.utcnow)
 
     model = relationship("CustomModel", back_populates="files")
 
+    __table_args__ = (
+        Index("ix_model_files_model_id", "model_id"),
+    )
+
 class ChatSession(Base):
     __tablename__ = "chat_sessions"
 
@@ -78,19 +89,38 @@ class ChatSession(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
 
     owner = relationship("User", back_populates="sessions")
-    messages = relationship("Message", back_populates="session", cascade="all, delete-orphan")
+    messages = relationship(
+        "Message", back_populates="session", cascade="all, delete-orphan",
+        passive_deletes=True, order_by="Message.id",
+    )
 
 class Message(Base):
     __tablename__ = "messages"
 
     id = Column(Integer, primary_key=True, index=True)
-    session_id = Column(String, ForeignKey("chat_sessions.id"))
+    session_id = Column(String, ForeignKey("chat_sessions.id", ondelete="CASCADE"))
     role = Column(String)  # 'user' or 'assistant'
     content = Column(Text)
     created_at = Column(DateTime, default=datetime.utcnow)
 
     session = relationship("ChatSession", back_populates="messages")
 
+    # Usage stats group by created_at within a session; without this the
+    # GROUP BY does a full sort
+    __table_args__ = (
+        Index("ix_messages_session_id_created_at", "session_id", "created_at"),
+    )
+
+    @staticmethod
+    def bulk_create(session, rows, chunk_size=1000):
+        """Insert message rows with Core executemany.
+
+        One INSERT per chunk instead of an ORM flush per row; chunked to
+        stay under driver parameter limits on large ingests.
+        """
+        for start in range(0, len(rows), chunk_size):
+            session.execute(insert(Message), rows[start:start + chunk_size])
+
 # ============================================================
 # JOB PLATFORM MODELS
 # ============================================================
@@ -144,12 +174,34 @@ class Job(Base):
     application_email = Column(String, nullable=True)
     views_count = Column(Integer, default=0)
     applications_count = Column(Integer, default=0)
+    expires_at = Column(DateTime, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
+    if is_postgres:
+        # Generated full-text column over title/description/requirements;
+        # GIN-indexed via migrate_add_indexes.py. SQLite has no tsvector,
+        # so the column (and the FTS query branch) are Postgres-only.
+        search_tsv = Column(TSVECTOR, Computed(
+            "to_tsvector('english', coalesce(title,'') || ' ' || "
+            "coalesce(description,'') || ' ' || coalesce(requirements,''))",
+            persisted=True,
+        ))
+
     company = relationship("Company", back_populates="jobs")
     posted_by = relationship("User", back_populates="jobs_posted")
-    applications = relationship("JobApplication", back_populates="job")
+    applications = relationship(
+        "JobApplication", back_populates="job",
+        cascade="all, delete-orphan", passive_deletes=True,
+    )
+
+    # The default search is status='active' ordered by created_at DESC;
+    # category filtering and per-company listings get their own indexes
+    __table_args__ = (
+        Index("ix_jobs_status_created_at", "status", "created_at"),
+        Index("ix_jobs_status_category_created_at", "status", "category", "created_at"),
+        Index("ix_jobs_company_id_status", "company_id", "status"),
+    )
 
 class Resume(Base):
     __tablename__ = "resumes"
@@ -204,21 +256,50 @@ class Resume(Base):
 
     user = relationship("User", back_populates="resume")
 
+    # Resume search filters public+active and orders by ats_score
+    __table_args__ = (
+        Index("ix_resumes_public_active_ats", "is_public", "is_active", "ats_score"),
+    )
+
+class ResumeSkill(Base):
+    """Normalized (resume_id, skill) rows mirroring Resume.skills.
+
+    The JSON column stays the source of truth for display; these rows
+    exist so skill lookups can use a btree index instead of scanning
+    and parsing JSON per row (SQLite has no JSON indexing at all).
+    Kept in sync by the resume write paths.
+    """
+    __tablename__ = "resume_skills"
+
+    id = Column(Integer, primary_key=True, index=True)
+    resume_id = Column(Integer, ForeignKey("resumes.id", ondelete="CASCADE"))
+    skill = Column(String)  # lowercased
+
+    __table_args__ = (
+        UniqueConstraint('resume_id', 'skill', name='unique_resume_skill'),
+        Index("ix_resume_skills_skill", "skill"),
+    )
+
+
 class JobApplication(Base):
     __tablename__ = "job_applications"
 
     id = Column(Integer, primary_key=True, index=True)
-    job_id = Column(Integer, ForeignKey("jobs.id"))
+    job_id = Column(Integer, ForeignKey("jobs.id", ondelete="CASCADE"))
     candidate_id = Column(Integer, ForeignKey("users.id"))
     resume_id = Column(Integer, ForeignKey("resumes.id"), nullable=True)
     
     # Application Details
     cover_letter = Column(Text, nullable=True)
+    custom_answers = Column(JSON, default=dict)
     status = Column(String, default="pending")  # pending, reviewing, shortlisted, rejected, hired
     
     # AI Matching
     match_score = Column(Float, nullable=True)
     match_reasons = Column(JSON, default=list)
+
+    # Recruiter notes
+    notes = Column(Text, nullable=True)
     
     # Timestamps
     applied_at = Column(DateTime, default=datetime.utcnow)
@@ -227,17 +308,26 @@ class JobApplication(Base):
     job = relationship("Job", back_populates="applications")
     candidate = relationship("User", back_populates="job_applications")
 
+    # Recruiter and candidate views filter on these pairs
+    __table_args__ = (
+        Index("ix_job_applications_job_id_status", "job_id", "status"),
+        Index("ix_job_applications_candidate_id_status", "candidate_id", "status"),
+    )
+
 class SavedJob(Base):
     __tablename__ = "saved_jobs"
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"))
-    job_id = Column(Integer, ForeignKey("jobs.id"), nullable=True)  # For internal jobs
+    job_id = Column(Integer, ForeignKey("jobs.id", ondelete="CASCADE"), nullable=True)  # For internal jobs
     external_job_id = Column(String, nullable=True)  # For external jobs (e.g., "jooble_123")
     job_source = Column(String, default="internal")  # "internal", "jooble", "adzuna", etc.
+    is_external = Column(Boolean, nullable=False, default=False, index=True)
     job_data = Column(JSON, default=dict)  # Store external job data for display
     created_at = Column(DateTime, default=datetime.utcnow)
 
+    job = relationship("Job")
+
     # Ensure unique saved jobs per user
     __table_args__ = (
         UniqueConstraint('user_id', 'job_id', name='unique_saved_job_internal'),
@@ -296,6 +386,11 @@ class Payment(Base):
 
     user = relationship("User", back_populates="payments")
 
+    # Payment history lists by user, newest first
+    __table_args__ = (
+        Index("ix_payments_user_id_created_at", "user_id", "created_at"),
+    )
+
 class UsageRecord(Base):
     """Track user usage for billing"""
     __tablename__ = "usage_records"
@@ -314,6 +409,17 @@ class UsageRecord(Base):
 
     user = relationship("User", back_populates="usage_records")
 
+    # Usage stats filter by user and time window
+    __table_args__ = (
+        Index("ix_usage_records_user_id_created_at", "user_id", "created_at"),
+    )
+
+    @staticmethod
+    def bulk_create(session, rows, chunk_size=1000):
+        """Insert usage rows with Core executemany (see Message.bulk_create)."""
+        for start in range(0, len(rows), chunk_size):
+            session.execute(insert(UsageRecord), rows[start:start + chunk_size])
+
 class CreditPurchase(Base):
     """Credit pack purchases"""
     __tablename__ = "credit_purchases"
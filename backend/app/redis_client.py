@@ -0,0 +1,19 @@
+"""Shared Redis client with an explicit connection pool.
+
+One blocking pool per process, with TCP keepalive and periodic health
+checks, so workers reuse warm connections instead of reconnecting per
+request; the pool blocks briefly under load rather than exhausting.
+"""
+import os
+
+import redis
+
+_pool = redis.BlockingConnectionPool.from_url(
+    os.getenv("REDIS_URL"),
+    max_connections=64,
+    socket_keepalive=True,
+    health_check_interval=30,
+    timeout=5,
+)
+
+r = redis.Redis(connection_pool=_pool)
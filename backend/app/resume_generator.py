@@ -6,8 +6,12 @@ Supports 3 different ATS-friendly templates.
 
 from typing import Dict, List, Any, Optional
 from datetime import datetime
+import asyncio
+import multiprocessing
 import os
 import io
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 
 # PDF Generation
 from reportlab.lib import colors
@@ -704,3 +708,36 @@ class ResumeGenerator:
 
 # Singleton instance
 resume_generator = ResumeGenerator()
+
+# reportlab/python-docx rendering is CPU-bound and holds the GIL, so the
+# async wrappers below run it in a separate process rather than a thread.
+# The pool is created lazily (spawn context: forking a threaded server
+# process is not fork-safe).
+_render_pool = None
+
+
+def _get_render_pool():
+    global _render_pool
+    if _render_pool is None:
+        _render_pool = ProcessPoolExecutor(
+            max_workers=2, mp_context=multiprocessing.get_context("spawn")
+        )
+    return _render_pool
+
+
+async def generate_pdf_async(resume_data, filename=None, template='modern', return_bytes=False):
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _get_render_pool(),
+        partial(resume_generator.generate_pdf, resume_data, filename,
+                template=template, return_bytes=return_bytes),
+    )
+
+
+async def generate_docx_async(resume_data, filename=None, template='modern', return_bytes=False):
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _get_render_pool(),
+        partial(resume_generator.generate_docx, resume_data, filename,
+                template=template, return_bytes=return_bytes),
+    )
@@ -30,17 +30,25 @@ class ResumeParser:
     
     def parse_file(self, content: bytes, filename: str) -> Dict[str, Any]:
         """Parse a resume file and extract comprehensive structured data."""
+        return self.parse_file_stream(BytesIO(content), filename)
+
+    def parse_file_stream(self, fileobj, filename: str) -> Dict[str, Any]:
+        """Parse a resume from a file object without buffering it in memory.
+
+        pypdf and python-docx both read from file-like objects directly,
+        so uploads spooled to a temp file never need a full bytes copy.
+        """
         # Extract text based on file type
         if filename.lower().endswith('.pdf'):
-            text = self._extract_pdf_text(content)
+            text = self._extract_pdf_stream(fileobj)
         elif filename.lower().endswith('.docx'):
-            text = self._extract_docx_text(content)
+            text = self._extract_docx_stream(fileobj)
         else:
             raise ValueError("Unsupported file format. Only PDF and DOCX are supported.")
-        
+
         # Parse using comprehensive extraction
         parsed_data = self._parse_resume_comprehensive(text)
-        
+
         return {
             "raw_text": text,
             "parsed_data": parsed_data,
@@ -49,8 +57,11 @@ class ResumeParser:
     
     def _extract_pdf_text(self, content: bytes) -> str:
         """Extract text from PDF file with better formatting preservation."""
+        return self._extract_pdf_stream(BytesIO(content))
+
+    def _extract_pdf_stream(self, pdf_file) -> str:
+        """Extract text from a PDF file object."""
         try:
-            pdf_file = BytesIO(content)
             reader = PdfReader(pdf_file)
             text_parts = []
             for page in reader.pages:
@@ -60,11 +71,14 @@ class ResumeParser:
             return "\n\n".join(text_parts).strip()
         except Exception as e:
             raise ValueError(f"Failed to parse PDF: {str(e)}")
-    
+
     def _extract_docx_text(self, content: bytes) -> str:
         """Extract text from DOCX file with structure preservation."""
+        return self._extract_docx_stream(BytesIO(content))
+
+    def _extract_docx_stream(self, docx_file) -> str:
+        """Extract text from a DOCX file object."""
         try:
-            docx_file = BytesIO(content)
             doc = Document(docx_file)
             text_parts = []
             
@@ -364,6 +364,10 @@ class ResumeSearchFilters(BaseModel):
     min_ats_score: Optional[int] = None
     page: int = 1
     limit: int = 20
+    # Keyset cursor (both fields from the previous page's next_cursor);
+    # when set, pagination seeks past (ats_score, id) instead of OFFSET
+    cursor_score: Optional[int] = None
+    cursor_id: Optional[int] = None
 
 
 class ResumeMatchResult(BaseModel):
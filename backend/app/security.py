@@ -1,13 +1,32 @@
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError, jwt
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, load_only
 from app.auth import SECRET_KEY, ALGORITHM
 from app.database import get_db
 from app.models import User
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
 
+# Columns the request handlers actually read from the authenticated user.
+# Anything else (google_id, stripe_subscription_id, ...) stays deferred and
+# is only fetched if an endpoint touches it.
+_USER_COLS = (
+    User.id,
+    User.email,
+    User.username,
+    User.user_type,
+    User.request_count,
+    User.tier,
+    User.is_premium,
+    User.improve_model,
+    User.credits,
+    User.credits_used,
+    User.stripe_customer_id,
+    User.subscription_status,
+    User.subscription_current_period_end,
+)
+
 def authenticate(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)):
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
@@ -21,7 +40,12 @@ def authenticate(token: str = Depends(oauth2_scheme), db: Session = Depends(get_
             raise credentials_exception
     except JWTError:
         raise credentials_exception
-    user = db.query(User).filter(User.email == email).first()  # Changed from username to email
+    user = (
+        db.query(User)
+        .options(load_only(*_USER_COLS))
+        .filter(User.email == email)  # Changed from username to email
+        .first()
+    )
     if user is None:
         raise credentials_exception
     return user
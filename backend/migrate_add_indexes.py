@@ -0,0 +1,83 @@
+"""
+Migration script to add performance indexes for hot query paths.
+Run this script against an existing database; new databases get the
+indexes automatically from the model definitions.
+"""
+
+import os
+import sys
+from sqlalchemy import create_engine, text
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.config import settings
+
+# (index name, table, columns) - CREATE INDEX IF NOT EXISTS works on both
+# SQLite and PostgreSQL
+INDEXES = [
+    ("ix_messages_session_id_created_at", "messages", "session_id, created_at"),
+    ("ix_model_files_model_id", "model_files", "model_id"),
+    ("ix_jobs_status_created_at", "jobs", "status, created_at"),
+    ("ix_resumes_public_active_ats", "resumes", "is_public, is_active, ats_score"),
+    ("ix_payments_user_id_created_at", "payments", "user_id, created_at"),
+    ("ix_usage_records_user_id_created_at", "usage_records", "user_id, created_at"),
+    ("ix_jobs_status_category_created_at", "jobs", "status, category, created_at"),
+    ("ix_jobs_company_id_status", "jobs", "company_id, status"),
+    ("ix_job_applications_job_id_status", "job_applications", "job_id, status"),
+    ("ix_job_applications_candidate_id_status", "job_applications", "candidate_id, status"),
+]
+
+# PostgreSQL-only statements (GIN/partial indexes SQLite can't express)
+POSTGRES_INDEXES = [
+    # Supports the single ?& skills predicate in search_jobs
+    """CREATE INDEX IF NOT EXISTS ix_jobs_skills_gin
+       ON jobs USING gin (((required_skills::jsonb) || (nice_to_have_skills::jsonb)))""",
+    # The default search: active jobs, newest first
+    """CREATE INDEX IF NOT EXISTS ix_jobs_active_created
+       ON jobs (created_at DESC) WHERE status = 'active'""",
+    # Common filter combinations on active jobs
+    """CREATE INDEX IF NOT EXISTS ix_jobs_cat_level
+       ON jobs (category, experience_level, employment_type) WHERE status = 'active'""",
+    # Supports the @> skills containment in search_resumes
+    """CREATE INDEX IF NOT EXISTS ix_resumes_skills_gin
+       ON resumes USING gin ((skills::jsonb) jsonb_path_ops)""",
+    # Generated full-text column + GIN index for the search_jobs query
+    # filter (new databases get the column from create_all)
+    """ALTER TABLE jobs ADD COLUMN IF NOT EXISTS search_tsv tsvector
+       GENERATED ALWAYS AS (to_tsvector('english', coalesce(title,'') || ' ' ||
+       coalesce(description,'') || ' ' || coalesce(requirements,''))) STORED""",
+    """CREATE INDEX IF NOT EXISTS ix_jobs_search_tsv
+       ON jobs USING gin (search_tsv)""",
+    # Unanchored ILIKE '%location%' needs a trigram index to avoid seq scans
+    """CREATE EXTENSION IF NOT EXISTS pg_trgm""",
+    """CREATE INDEX IF NOT EXISTS ix_jobs_location_trgm
+       ON jobs USING gin (location gin_trgm_ops)""",
+]
+
+
+def migrate():
+    """Create missing indexes."""
+    engine = create_engine(settings.DATABASE_URL)
+    is_postgres = "postgresql" in settings.DATABASE_URL.lower()
+
+    with engine.connect() as connection:
+        for name, table, columns in INDEXES:
+            print(f"Ensuring index {name} on {table} ({columns})...")
+            connection.execute(text(
+                f"CREATE INDEX IF NOT EXISTS {name} ON {table} ({columns})"
+            ))
+        if is_postgres:
+            for statement in POSTGRES_INDEXES:
+                try:
+                    connection.execute(text(statement))
+                except Exception as e:
+                    # e.g. CREATE EXTENSION needs superuser; skip and continue
+                    connection.rollback()
+                    print(f"Skipping statement ({e}): {statement.splitlines()[0]}")
+        connection.commit()
+        print("Index migration completed successfully!")
+
+
+if __name__ == "__main__":
+    migrate()
@@ -0,0 +1,50 @@
+"""
+Migration script to add the expires_at column to jobs.
+JobCreate has always accepted expires_at, but the column was missing from
+the model, so posting a job with it raised TypeError; new databases get
+the column from create_all.
+"""
+
+import os
+import sys
+from sqlalchemy import create_engine, text
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.config import settings
+
+
+def migrate():
+    """Add expires_at column to jobs table."""
+    engine = create_engine(settings.DATABASE_URL)
+    is_postgres = "postgresql" in settings.DATABASE_URL.lower()
+
+    with engine.connect() as connection:
+        if is_postgres:
+            result = connection.execute(text("""
+                SELECT column_name
+                FROM information_schema.columns
+                WHERE table_name = 'jobs'
+                AND column_name = 'expires_at'
+            """))
+            if result.fetchone():
+                print("Migration already applied - column exists.")
+                return
+            column_type = "TIMESTAMP"
+        else:
+            result = connection.execute(text("PRAGMA table_info(jobs)"))
+            columns = [row[1] for row in result.fetchall()]
+            if 'expires_at' in columns:
+                print("Migration already applied - column exists.")
+                return
+            column_type = "DATETIME"
+
+        print("Adding expires_at column to jobs...")
+        connection.execute(text(f"ALTER TABLE jobs ADD COLUMN expires_at {column_type}"))
+        connection.commit()
+        print("Migration completed successfully!")
+
+
+if __name__ == "__main__":
+    migrate()
@@ -0,0 +1,96 @@
+"""
+Migration script to move child-row cleanup into the database.
+Rewrites the messages, model_files, and job_applications foreign keys
+with ON DELETE CASCADE so deleting a session/model/job is one DELETE
+instead of loading and deleting every child row. SQLite can't alter
+constraints, so those tables are rebuilt in place.
+"""
+
+import os
+import sys
+from sqlalchemy import create_engine, text
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.config import settings
+
+# (table, fk column, parent table, parent column)
+CASCADES = [
+    ("messages", "session_id", "chat_sessions", "id"),
+    ("model_files", "model_id", "custom_models", "id"),
+    ("job_applications", "job_id", "jobs", "id"),
+    # With FK enforcement on, saved rows would otherwise block job deletes
+    ("saved_jobs", "job_id", "jobs", "id"),
+]
+
+
+def _rebuild_sqlite_table(connection, table, fk_column, parent, parent_col):
+    """Recreate a SQLite table with ON DELETE CASCADE on one FK."""
+    create_sql = connection.execute(
+        text("SELECT sql FROM sqlite_master WHERE type='table' AND name=:name"),
+        {"name": table},
+    ).scalar()
+    fk_clause = f'REFERENCES {parent} ({parent_col})'
+    if "ON DELETE CASCADE" in create_sql:
+        print(f"{table}: cascade already present - skipping.")
+        return
+    if fk_clause not in create_sql:
+        # Some dumps quote identifiers; try the quoted form
+        fk_clause = f'REFERENCES "{parent}" ("{parent_col}")'
+        if fk_clause not in create_sql:
+            print(f"{table}: FK clause not found - skipping.")
+            return
+
+    new_sql = create_sql.replace(
+        fk_clause, f"{fk_clause} ON DELETE CASCADE", 1
+    ).replace(f"CREATE TABLE {table}", f"CREATE TABLE {table}_new", 1)
+
+    columns = [row[1] for row in connection.execute(text(f"PRAGMA table_info({table})"))]
+    column_list = ", ".join(columns)
+
+    connection.execute(text("PRAGMA foreign_keys=OFF"))
+    connection.execute(text(new_sql))
+    connection.execute(text(
+        f"INSERT INTO {table}_new ({column_list}) SELECT {column_list} FROM {table}"
+    ))
+    connection.execute(text(f"DROP TABLE {table}"))
+    connection.execute(text(f"ALTER TABLE {table}_new RENAME TO {table}"))
+    connection.execute(text("PRAGMA foreign_keys=ON"))
+    print(f"{table}: rebuilt with ON DELETE CASCADE.")
+
+
+def migrate():
+    """Add ON DELETE CASCADE to the child-table foreign keys."""
+    engine = create_engine(settings.DATABASE_URL)
+    is_postgres = "postgresql" in settings.DATABASE_URL.lower()
+
+    with engine.connect() as connection:
+        if is_postgres:
+            for table, fk_column, parent, parent_col in CASCADES:
+                constraint = f"{table}_{fk_column}_fkey"
+                try:
+                    connection.execute(text(
+                        f"ALTER TABLE {table} DROP CONSTRAINT IF EXISTS {constraint}"
+                    ))
+                    connection.execute(text(
+                        f"ALTER TABLE {table} ADD CONSTRAINT {constraint} "
+                        f"FOREIGN KEY ({fk_column}) REFERENCES {parent} ({parent_col}) "
+                        f"ON DELETE CASCADE"
+                    ))
+                    print(f"{table}: cascade constraint replaced.")
+                except Exception as e:
+                    connection.rollback()
+                    print(f"Skipping {table} ({e})")
+        else:
+            for table, fk_column, parent, parent_col in CASCADES:
+                _rebuild_sqlite_table(connection, table, fk_column, parent, parent_col)
+        connection.commit()
+        print("Cascade migration completed!")
+        if not is_postgres:
+            print("Note: rebuilt tables drop secondary indexes - run "
+                  "migrate_add_indexes.py afterwards to recreate them.")
+
+
+if __name__ == "__main__":
+    migrate()
@@ -0,0 +1,54 @@
+"""
+Migration script to add the custom_answers and notes columns to
+job_applications. The apply and review endpoints have always used them,
+but the columns were missing from the model; new databases get them
+from create_all.
+"""
+
+import os
+import sys
+from sqlalchemy import create_engine, text
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.config import settings
+
+COLUMNS = [
+    ("custom_answers", "JSON", "JSONB"),
+    ("notes", "TEXT", "TEXT"),
+]
+
+
+def migrate():
+    """Add missing columns to job_applications table."""
+    engine = create_engine(settings.DATABASE_URL)
+    is_postgres = "postgresql" in settings.DATABASE_URL.lower()
+
+    with engine.connect() as connection:
+        if is_postgres:
+            result = connection.execute(text("""
+                SELECT column_name
+                FROM information_schema.columns
+                WHERE table_name = 'job_applications'
+            """))
+            existing = {row[0] for row in result.fetchall()}
+        else:
+            result = connection.execute(text("PRAGMA table_info(job_applications)"))
+            existing = {row[1] for row in result.fetchall()}
+
+        for name, sqlite_type, pg_type in COLUMNS:
+            if name in existing:
+                print(f"Column {name} already exists - skipping.")
+                continue
+            column_type = pg_type if is_postgres else sqlite_type
+            print(f"Adding {name} column to job_applications...")
+            connection.execute(text(
+                f"ALTER TABLE job_applications ADD COLUMN {name} {column_type}"
+            ))
+        connection.commit()
+        print("Migration completed successfully!")
+
+
+if __name__ == "__main__":
+    migrate()
@@ -0,0 +1,47 @@
+"""
+Migration script to add the file_type column to model_files.
+The upload endpoint always passed file_type, but the column was missing
+from the model; new databases get it from create_all.
+"""
+
+import os
+import sys
+from sqlalchemy import create_engine, text
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.config import settings
+
+
+def migrate():
+    """Add file_type column to model_files table."""
+    engine = create_engine(settings.DATABASE_URL)
+    is_postgres = "postgresql" in settings.DATABASE_URL.lower()
+
+    with engine.connect() as connection:
+        if is_postgres:
+            result = connection.execute(text("""
+                SELECT column_name
+                FROM information_schema.columns
+                WHERE table_name = 'model_files'
+                AND column_name = 'file_type'
+            """))
+            if result.fetchone():
+                print("Migration already applied - column exists.")
+                return
+        else:
+            result = connection.execute(text("PRAGMA table_info(model_files)"))
+            columns = [row[1] for row in result.fetchall()]
+            if 'file_type' in columns:
+                print("Migration already applied - column exists.")
+                return
+
+        print("Adding file_type column to model_files...")
+        connection.execute(text("ALTER TABLE model_files ADD COLUMN file_type VARCHAR"))
+        connection.commit()
+        print("Migration completed successfully!")
+
+
+if __name__ == "__main__":
+    migrate()
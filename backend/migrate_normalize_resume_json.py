@@ -0,0 +1,72 @@
+"""
+Migration script to normalize resume JSON list columns.
+Older rows stored work_experience/education/... entries as stringified
+Python dicts, forcing every read to run ast.literal_eval. This rewrites
+those entries as real JSON objects once; writes normalize going forward.
+"""
+
+import ast
+import json
+import os
+import sys
+from sqlalchemy import create_engine, text
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.config import settings
+
+FIELDS = ["work_experience", "education", "certifications", "projects", "languages"]
+
+
+def normalize(items):
+    changed = False
+    normalized = []
+    for item in items or []:
+        if isinstance(item, str) and item.startswith("{") and item.endswith("}"):
+            try:
+                parsed = ast.literal_eval(item)
+                if isinstance(parsed, dict):
+                    normalized.append(parsed)
+                    changed = True
+                    continue
+            except (ValueError, SyntaxError):
+                pass
+        normalized.append(item)
+    return normalized, changed
+
+
+def migrate():
+    """Rewrite stringified-dict entries as structured JSON."""
+    engine = create_engine(settings.DATABASE_URL)
+
+    with engine.connect() as connection:
+        columns = ", ".join(FIELDS)
+        rows = connection.execute(text(f"SELECT id, {columns} FROM resumes")).fetchall()
+
+        updated = 0
+        for row in rows:
+            resume_id = row[0]
+            updates = {}
+            for index, field in enumerate(FIELDS, start=1):
+                value = row[index]
+                if isinstance(value, str):
+                    value = json.loads(value)
+                normalized, changed = normalize(value)
+                if changed:
+                    updates[field] = json.dumps(normalized)
+
+            if updates:
+                assignments = ", ".join(f"{field} = :{field}" for field in updates)
+                connection.execute(
+                    text(f"UPDATE resumes SET {assignments} WHERE id = :id"),
+                    {**updates, "id": resume_id},
+                )
+                updated += 1
+
+        connection.commit()
+        print(f"Normalized {updated} of {len(rows)} resumes.")
+
+
+if __name__ == "__main__":
+    migrate()
@@ -0,0 +1,55 @@
+"""
+Migration script to create and backfill the resume_skills table.
+New databases get the table from create_all; this backfills normalized
+(resume_id, skill) rows from the existing Resume.skills JSON so skill
+searches can use the btree index immediately.
+"""
+
+import json
+import os
+import sys
+from sqlalchemy import create_engine, text
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.config import settings
+
+
+def migrate():
+    """Create resume_skills (if missing) and backfill from Resume.skills."""
+    # Importing models ensures create_all knows about ResumeSkill
+    from app.database import engine as app_engine, Base
+    from app import models  # noqa: F401
+
+    Base.metadata.create_all(bind=app_engine)
+
+    engine = create_engine(settings.DATABASE_URL)
+    with engine.connect() as connection:
+        rows = connection.execute(text("SELECT id, skills FROM resumes")).fetchall()
+
+        inserted = 0
+        for resume_id, skills in rows:
+            if isinstance(skills, str):
+                skills = json.loads(skills) if skills else []
+            normalized = sorted({
+                skill.lower().strip() for skill in (skills or [])
+                if isinstance(skill, str)
+            })
+            connection.execute(
+                text("DELETE FROM resume_skills WHERE resume_id = :rid"),
+                {"rid": resume_id},
+            )
+            for skill in normalized:
+                connection.execute(
+                    text("INSERT INTO resume_skills (resume_id, skill) VALUES (:rid, :skill)"),
+                    {"rid": resume_id, "skill": skill},
+                )
+                inserted += 1
+
+        connection.commit()
+        print(f"Backfilled {inserted} skill rows for {len(rows)} resumes.")
+
+
+if __name__ == "__main__":
+    migrate()
@@ -0,0 +1,60 @@
+"""
+Migration script to add the is_external flag to saved_jobs.
+Backfills the flag from external_job_id so existing rows keep working;
+new saves set it explicitly and readers branch on the column instead of
+sniffing the id string.
+"""
+
+import os
+import sys
+from sqlalchemy import create_engine, text
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.config import settings
+
+
+def migrate():
+    """Add and backfill the is_external column on saved_jobs."""
+    engine = create_engine(settings.DATABASE_URL)
+    is_postgres = "postgresql" in settings.DATABASE_URL.lower()
+
+    with engine.connect() as connection:
+        if is_postgres:
+            result = connection.execute(text("""
+                SELECT column_name
+                FROM information_schema.columns
+                WHERE table_name = 'saved_jobs'
+                AND column_name = 'is_external'
+            """))
+            exists = result.fetchone() is not None
+        else:
+            result = connection.execute(text("PRAGMA table_info(saved_jobs)"))
+            exists = 'is_external' in [row[1] for row in result.fetchall()]
+
+        if exists:
+            print("Migration already applied - column exists.")
+            return
+
+        print("Adding is_external column to saved_jobs...")
+        connection.execute(text(
+            "ALTER TABLE saved_jobs ADD COLUMN is_external BOOLEAN NOT NULL DEFAULT 0"
+            if not is_postgres else
+            "ALTER TABLE saved_jobs ADD COLUMN is_external BOOLEAN NOT NULL DEFAULT FALSE"
+        ))
+        connection.execute(text(
+            "UPDATE saved_jobs SET is_external = (external_job_id IS NOT NULL)"
+        ))
+        if is_postgres:
+            # Keep the hot internal/external scans on tiny partial indexes
+            connection.execute(text(
+                "CREATE INDEX IF NOT EXISTS ix_saved_jobs_user_external "
+                "ON saved_jobs (user_id) WHERE is_external"
+            ))
+        connection.commit()
+        print("Migration completed successfully!")
+
+
+if __name__ == "__main__":
+    migrate()